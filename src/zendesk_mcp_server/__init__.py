@@ -4,7 +4,7 @@ from . import server
 
 
 def main():
-    asyncio.run(server.main())
+    asyncio.run(server.main(), loop_factory=server.EVENT_LOOP_FACTORY)
 
 
 __all__ = ["main", "server"]
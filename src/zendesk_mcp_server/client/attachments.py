@@ -29,17 +29,21 @@ class AttachmentsMixin:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
 
-            # Get file info
             filename = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path)
 
-            # Check file size (50 MB limit)
-            max_size = 50 * 1024 * 1024  # 50 MB in bytes
-            if file_size > max_size:
-                raise ZendeskValidationError(f"File size ({file_size} bytes) exceeds 50 MB limit")
+            # Upload an open handle: requests streams file objects in blocks, so
+            # memory stays flat regardless of file size, and the size check and
+            # upload see the same file
+            with open(file_path, 'rb') as fp:
+                file_size = os.fstat(fp.fileno()).st_size
 
-            # Upload using zenpy
-            upload_result = self.client.attachments.upload(file_path)
+                # Check file size (50 MB limit)
+                max_size = 50 * 1024 * 1024  # 50 MB in bytes
+                if file_size > max_size:
+                    raise ZendeskValidationError(f"File size ({file_size} bytes) exceeds 50 MB limit")
+
+                # Upload using zenpy, named by the file's basename rather than its local path
+                upload_result = self.client.attachments.upload(fp, target_name=filename)
 
             return {
                 'token': upload_result.token,
@@ -1,13 +1,24 @@
 """Base ZendeskClient class and core utilities."""
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import importlib.util
 import json
+import random
 import urllib.request
 import urllib.parse
 import urllib.error
 import base64
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from zenpy import Zenpy
+
+try:
+    import httpx
+except ImportError:  # async reads fall back to the client thread pool
+    httpx = None
 from zendesk_mcp_server.exceptions import (
     ZendeskError,
     ZendeskAPIError,
@@ -72,6 +83,94 @@ def _urlopen_with_retry(req, max_attempts: int = 5):
     raise ZendeskError("Unknown error during URL open.")
 
 
+async def _aget_with_retry(client: Any, url: str, headers: Dict[str, str], max_attempts: int = 5) -> Any:
+    """Async counterpart of _urlopen_with_retry for an httpx.AsyncClient GET."""
+    for attempt in range(max_attempts):
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError as e:
+            # Treat network errors as retryable
+            if attempt < max_attempts - 1:
+                await asyncio.sleep(min(2 ** attempt + random.random(), 30))
+                continue
+            raise ZendeskNetworkError(f"Network Error: {str(e)}")
+
+        code = response.status_code
+        # Retry on 429 Too Many Requests or transient 5xx errors, honoring Retry-After
+        if (code == 429 or 500 <= code < 600) and attempt < max_attempts - 1:
+            retry_after = (response.headers.get("Retry-After") or "").strip()
+            delay = int(retry_after) if retry_after.isdigit() else min(2 ** attempt + random.random(), 30)
+            await asyncio.sleep(delay)
+            continue
+        if code >= 400:
+            raise ZendeskAPIError(
+                f"HTTP Error: {code} - {response.reason_phrase}",
+                status_code=code,
+                response_body=response.text or "No response body",
+            )
+        return response
+    raise ZendeskError("Unknown error during async GET.")
+
+
+# Keep-alive pool sizing for the HTTP session shared with zenpy. pool_maxsize
+# bounds concurrently reusable connections to the Zendesk host, so it should
+# cover the widest fan-out used by the handlers.
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+
+# Connection-level retries for pooled connections that were dropped while idle.
+# HTTP status retries (429/5xx) stay with zenpy and _urlopen_with_retry.
+HTTP_CONNECT_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=())
+
+# Threads for the independent requests a single client method fans out (e.g.
+# the searches behind find_related_tickets). Kept apart from the server's
+# client pool so a saturated pool never waits on its own subtasks.
+_FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix="zendesk-fanout")
+
+
+def _fan_out(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Future]:
+    """Start independent blocking calls concurrently, returning a future per name.
+
+    Callers read each future's result() where they previously made the call, so
+    a failing call raises at the same point it used to.
+    """
+    return {name: _FANOUT_EXECUTOR.submit(call) for name, call in calls.items()}
+
+
+def _build_http_session() -> requests.Session:
+    """Create a requests session with a keep-alive connection pool.
+
+    Built once per client so every zenpy call reuses warm TCP/TLS connections
+    instead of paying a fresh handshake.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=HTTP_CONNECT_RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Per-request timeout for the async client (urllib calls have none, but httpx
+# defaults to 5s, which is too short for large search and survey pages)
+ASYNC_HTTP_TIMEOUT_SECONDS = 60.0
+
+
+def _build_async_http_client() -> Any:
+    """Create an httpx.AsyncClient with the same keep-alive pool size as the sync session.
+
+    HTTP/2 is enabled when the optional h2 package is installed.
+    """
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=HTTP_POOL_MAXSIZE, max_keepalive_connections=HTTP_POOL_MAXSIZE),
+        timeout=ASYNC_HTTP_TIMEOUT_SECONDS,
+    )
+
+
 class ZendeskClientBase:
     """Base class for ZendeskClient with core initialization and helpers."""
     
@@ -79,10 +178,12 @@ class ZendeskClientBase:
         """
         Initialize the Zendesk client using zenpy lib and direct API.
         """
+        self.session = _build_http_session()
         self.client = Zenpy(
             subdomain=subdomain,
             email=email,
-            token=token
+            token=token,
+            session=self.session,
         )
 
         # For direct API calls
@@ -119,7 +220,7 @@ class ZendeskClientBase:
         req.add_header('Authorization', self.auth_header)
         req.add_header('Content-Type', 'application/json')
         with _urlopen_with_retry(req) as response:
-            return json.loads(response.read().decode('utf-8'))
+            return json.loads(response.read())
 
     # Internal helper to GET a fully-qualified URL (e.g., next_page) and return parsed JSON
     def _get_json_url(self, url: str) -> Dict[str, Any]:
@@ -127,8 +228,43 @@ class ZendeskClientBase:
         req.add_header('Authorization', self.auth_header)
         req.add_header('Content-Type', 'application/json')
         with _urlopen_with_retry(req) as response:
-            return json.loads(response.read().decode('utf-8'))
+            return json.loads(response.read())
     
+    # Async variant of _get_json; awaits on the event loop instead of occupying a pool thread
+    async def _get_json_async(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        query = urllib.parse.urlencode(params or {})
+        return await self._get_json_url_async(f"{self.base_url}{path}{('?' + query) if query else ''}")
+
+    # Async variant of _get_json_url; without httpx the sync call runs on the default executor
+    async def _get_json_url_async(self, url: str) -> Dict[str, Any]:
+        if httpx is None:
+            return await asyncio.get_running_loop().run_in_executor(None, self._get_json_url, url)
+        response = await _aget_with_retry(
+            self._async_http(),
+            url,
+            {'Authorization': self.auth_header, 'Content-Type': 'application/json'},
+        )
+        return json.loads(response.content)
+
+    def _async_http(self) -> Any:
+        """Return the httpx.AsyncClient for the running loop, creating it on first use.
+
+        An AsyncClient is bound to the loop it was first used on, so a new one is
+        built if the client outlives its loop (e.g. across asyncio.run calls).
+        """
+        loop = asyncio.get_running_loop()
+        if getattr(self, "_async_http_loop", None) is not loop:
+            self._async_http_client = _build_async_http_client()
+            self._async_http_loop = loop
+        return self._async_http_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was opened on the running loop."""
+        client = getattr(self, "_async_http_client", None)
+        if client is not None and getattr(self, "_async_http_loop", None) is asyncio.get_running_loop():
+            await client.aclose()
+        self._async_http_client = self._async_http_loop = None
+
     # Incremental API generic fetcher
     def _incremental_fetch(
         self,
@@ -1,35 +1,60 @@
 """Knowledge base (Help Center) methods for ZendeskClient."""
-from typing import Any, Dict, List
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List
 
+from zendesk_mcp_server.client.base import _fan_out
 from zendesk_mcp_server.exceptions import ZendeskError, ZendeskAPIError, ZendeskValidationError
 
+# Largest page Help Center list endpoints serve under cursor pagination
+HELP_CENTER_PAGE_SIZE = 100
+
 
 class KnowledgeBaseMixin:
     """Mixin providing knowledge base/Help Center methods."""
     
+    def _iter_help_center_pages(self, path: str, key: str) -> Iterator[Dict[str, Any]]:
+        """Yield every record under key from a Help Center list endpoint.
+
+        Sending page[size] opts the endpoint into cursor pagination; pages are
+        followed via links.next while meta.has_more is set.
+        """
+        data = self._get_json(path, params={'page[size]': HELP_CENTER_PAGE_SIZE})
+        while True:
+            yield from data.get(key) or []
+            next_url = (data.get('links') or {}).get('next')
+            if not (data.get('meta') or {}).get('has_more') or not next_url:
+                return
+            data = self._get_json_url(next_url)
+
     def get_all_articles(self) -> Dict[str, Any]:
         """Fetch help center articles as knowledge base.
         
         Returns a Dict of section -> [article].
+        Sections and articles are each streamed over cursor pagination, with
+        the section listing fetched alongside the articles rather than one
+        articles request per section.
         """
         try:
-            # Get all sections
-            sections = self.client.help_center.sections()
+            pending = _fan_out({
+                'sections': lambda: list(self._iter_help_center_pages('/help_center/sections', 'sections'))
+            })
+            articles_by_section: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+            for article in self._iter_help_center_pages('/help_center/articles', 'articles'):
+                articles_by_section[article.get('section_id')].append({
+                    'id': article.get('id'),
+                    'title': article.get('title'),
+                    'body': article.get('body'),
+                    'updated_at': str(article.get('updated_at')),
+                    'url': article.get('html_url')
+                })
+            sections = pending['sections'].result()
 
-            # Get articles for each section
             kb = {}
             for section in sections:
-                articles = self.client.help_center.sections.articles(section.id)
-                kb[section.name] = {
-                    'section_id': section.id,
-                    'description': section.description,
-                    'articles': [{
-                        'id': article.id,
-                        'title': article.title,
-                        'body': article.body,
-                        'updated_at': str(article.updated_at),
-                        'url': article.html_url
-                    } for article in articles]
+                kb[section.get('name')] = {
+                    'section_id': section.get('id'),
+                    'description': section.get('description'),
+                    'articles': articles_by_section.get(section.get('id'), [])
                 }
 
             return kb
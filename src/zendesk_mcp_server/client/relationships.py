@@ -1,6 +1,8 @@
 """Ticket relationship methods for ZendeskClient."""
+import functools
 from typing import Any, Dict
 
+from zendesk_mcp_server.client.base import _fan_out
 from zendesk_mcp_server.exceptions import ZendeskError, ZendeskAPIError, ZendeskValidationError
 
 
@@ -26,14 +28,26 @@ class RelationshipsMixin:
             related_tickets = []
             search_strategies = []
 
+            # The three searches are independent, so they run concurrently
+            searches = {}
+            if subject_terms:
+                searches['subject'] = functools.partial(
+                    self.search_tickets_export, query=f'subject:"{subject_terms}"', max_results=limit
+                )
+            if requester_id:
+                searches['requester'] = functools.partial(
+                    self.search_tickets_export, query=f'requester_id:{requester_id}', max_results=limit
+                )
+            if organization_id:
+                searches['organization'] = functools.partial(
+                    self.search_tickets_export, query=f'organization_id:{organization_id}', max_results=limit
+                )
+            pending = _fan_out(searches)
+
             # Search 1: Similar subject (if we have terms)
             if subject_terms:
                 try:
-                    subject_query = f'subject:"{subject_terms}"'
-                    subject_results = self.search_tickets_export(
-                        query=subject_query,
-                        max_results=limit
-                    )
+                    subject_results = pending['subject'].result()
 
                     for ticket in subject_results.get('tickets', []):
                         if ticket['id'] != ticket_id:  # Exclude reference ticket
@@ -49,11 +63,7 @@ class RelationshipsMixin:
             # Search 2: Same requester
             if requester_id:
                 try:
-                    requester_query = f'requester_id:{requester_id}'
-                    requester_results = self.search_tickets_export(
-                        query=requester_query,
-                        max_results=limit
-                    )
+                    requester_results = pending['requester'].result()
 
                     for ticket in requester_results.get('tickets', []):
                         if ticket['id'] != ticket_id:  # Exclude reference ticket
@@ -71,11 +81,7 @@ class RelationshipsMixin:
             # Search 3: Same organization (if present)
             if organization_id:
                 try:
-                    org_query = f'organization_id:{organization_id}'
-                    org_results = self.search_tickets_export(
-                        query=org_query,
-                        max_results=limit
-                    )
+                    org_results = pending['organization'].result()
 
                     for ticket in org_results.get('tickets', []):
                         if ticket['id'] != ticket_id:  # Exclude reference ticket
@@ -130,15 +136,21 @@ class RelationshipsMixin:
             duplicate_candidates = []
             similarity_threshold = 0.7  # Minimum similarity score
 
+            # The similar-subject and exact-subject searches are independent, so they run concurrently
+            searches = {
+                'exact': functools.partial(self.search_tickets_export, query=f'subject:"{subject}"', max_results=limit)
+            }
+            if subject_terms:
+                # Use a broader search to catch potential duplicates; get more to filter by similarity
+                searches['similar'] = functools.partial(
+                    self.search_tickets_export, query=f'subject:"{subject_terms}"', max_results=limit * 2
+                )
+            pending = _fan_out(searches)
+
             # Search for tickets with similar subjects
             if subject_terms:
                 try:
-                    # Use a broader search to catch potential duplicates
-                    subject_query = f'subject:"{subject_terms}"'
-                    subject_results = self.search_tickets_export(
-                        query=subject_query,
-                        max_results=limit * 2  # Get more to filter by similarity
-                    )
+                    subject_results = pending['similar'].result()
 
                     for ticket in subject_results.get('tickets', []):
                         if ticket['id'] != ticket_id:  # Exclude reference ticket
@@ -165,11 +177,7 @@ class RelationshipsMixin:
 
             # Also search by exact subject match (highest priority)
             try:
-                exact_subject_query = f'subject:"{subject}"'
-                exact_results = self.search_tickets_export(
-                    query=exact_subject_query,
-                    max_results=limit
-                )
+                exact_results = pending['exact'].result()
 
                 for ticket in exact_results.get('tickets', []):
                     if ticket['id'] != ticket_id:  # Exclude reference ticket
@@ -207,6 +215,9 @@ class RelationshipsMixin:
     def find_ticket_thread(self, ticket_id: int) -> Dict[str, Any]:
         """Find all tickets in a conversation thread using via_id relationships."""
         try:
+            # The child search doesn't depend on the reference ticket, so it runs alongside the ticket lookups
+            pending = _fan_out({'children': functools.partial(self.search_tickets_export, query=f'via_id:{ticket_id}')})
+
             # Get the reference ticket with full details
             reference_ticket = self.client.tickets(id=ticket_id)
 
@@ -235,10 +246,7 @@ class RelationshipsMixin:
 
             # Search for child tickets (tickets that reference this ticket as via_id)
             try:
-                child_query = f'via_id:{ticket_id}'
-                child_results = self.search_tickets_export(
-                    query=child_query
-                )
+                child_results = pending['children'].result()
 
                 for ticket in child_results.get('tickets', []):
                     child_ticket = {
@@ -296,6 +304,9 @@ class RelationshipsMixin:
     def get_ticket_relationships(self, ticket_id: int) -> Dict[str, Any]:
         """Get parent/child ticket relationships via the via field."""
         try:
+            # The child search doesn't depend on the reference ticket, so it runs alongside the ticket lookups
+            pending = _fan_out({'children': functools.partial(self.search_tickets_export, query=f'via_id:{ticket_id}')})
+
             # Get the reference ticket with full details
             reference_ticket = self.client.tickets(id=ticket_id)
 
@@ -308,6 +319,10 @@ class RelationshipsMixin:
             # Check for parent relationship (via_id field)
             via_id = getattr(reference_ticket, 'via_id', None)
             if via_id:
+                # Siblings only need via_id, so that search runs while the parent is fetched
+                pending.update(_fan_out({
+                    'siblings': functools.partial(self.search_tickets_export, query=f'via_id:{via_id} -id:{ticket_id}')
+                }))
                 try:
                     parent_ticket = self.client.tickets(id=via_id)
                     relationships['parent'] = {
@@ -325,10 +340,7 @@ class RelationshipsMixin:
 
             # Search for child tickets
             try:
-                child_query = f'via_id:{ticket_id}'
-                child_results = self.search_tickets_export(
-                    query=child_query
-                )
+                child_results = pending['children'].result()
 
                 for ticket in child_results.get('tickets', []):
                     child_ticket = {
@@ -349,10 +361,8 @@ class RelationshipsMixin:
             # Search for sibling tickets (tickets with same parent)
             if via_id:
                 try:
-                    sibling_query = f'via_id:{via_id} -id:{ticket_id}'  # Same parent, exclude self
-                    sibling_results = self.search_tickets_export(
-                        query=sibling_query
-                    )
+                    # Same parent, excluding self
+                    sibling_results = pending['siblings'].result()
 
                     for ticket in sibling_results.get('tickets', []):
                         sibling_ticket = {
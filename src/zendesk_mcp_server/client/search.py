@@ -1,4 +1,5 @@
 """Search-related methods for ZendeskClient."""
+import functools
 import re
 from typing import Any, Dict, List
 from datetime import datetime, timedelta, date, timezone
@@ -13,6 +14,59 @@ from zendesk_mcp_server.exceptions import ZendeskError, ZendeskAPIError, Zendesk
 BATCH_SEARCH_CONCURRENCY = 3
 TOP_ENTITY_BREAKDOWN = 50
 DEFAULT_ANALYTICS_MAX_RESULTS = 10000
+# Largest page the search export endpoint serves; zenpy's cursor pagination
+# otherwise asks for 100 per page
+SEARCH_EXPORT_PAGE_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a caller-supplied regex once; agents tend to reuse patterns across a session."""
+    return re.compile(pattern, flags)
+
+
+def _word_similarity(s1: str, words1: frozenset, s2: str) -> float:
+    """Score two lowercased subjects by word overlap; words1 is s1's precomputed word set.
+
+    Taking s1's words from the caller lets a filter scoring one term against
+    many tickets split and hash the term only once.
+    """
+    # Exact match
+    if s1 == s2:
+        return 1.0
+
+    words2 = set(s2.split())
+    if not words1 or not words2:
+        return 0.0
+
+    # Jaccard similarity; both sets are non-empty so the union is too
+    intersection = len(words1.intersection(words2))
+    similarity = intersection / (len(words1) + len(words2) - intersection)
+
+    # Boost score if one subject contains the other
+    if s1 in s2 or s2 in s1:
+        similarity = min(1.0, similarity + 0.2)
+
+    return similarity
+
+
+def _quarter_start(now: datetime) -> datetime:
+    """Return the first day of the calendar quarter containing now."""
+    return now.replace(month=((now.month - 1) // 3) * 3 + 1, day=1)
+
+
+# relative_period -> function of now returning the (start, end) datetimes of the range
+_RELATIVE_PERIODS = {
+    "last_7_days": lambda now: (now - timedelta(days=7), now),
+    "last_30_days": lambda now: (now - timedelta(days=30), now),
+    "this_month": lambda now: (now.replace(day=1), now),
+    "last_month": lambda now: (
+        (now.replace(day=1) - timedelta(days=1)).replace(day=1),
+        now.replace(day=1) - timedelta(days=1),
+    ),
+    "this_quarter": lambda now: (_quarter_start(now), now),
+    "last_quarter": lambda now: (_quarter_start(now) - timedelta(days=90), _quarter_start(now)),
+}
 
 class SearchMixin:
     """Mixin providing search-related methods."""
@@ -99,8 +153,12 @@ class SearchMixin:
                 raise ZendeskValidationError("Search query cannot be empty")
 
             # Build search parameters - Export API does not support sorting
-            # Sort parameters are stripped and applied client-side instead
-            search_params = {'type': 'ticket'}
+            # Sort parameters are stripped and applied client-side instead.
+            # Pages are cursor-based; request as many per page as will be used.
+            search_params = {
+                'type': 'ticket',
+                'cursor_pagination': min(max_results, SEARCH_EXPORT_PAGE_SIZE) if max_results else SEARCH_EXPORT_PAGE_SIZE,
+            }
 
             # Execute search export using zenpy (without sort parameters)
             search_results = self.client.search_export(query, **search_params)
@@ -236,7 +294,7 @@ class SearchMixin:
             fields = ['subject', 'description']
 
         try:
-            pattern = re.compile(regex_pattern, re.IGNORECASE)
+            pattern = _compile_pattern(regex_pattern, re.IGNORECASE)
             filtered_tickets = []
             for ticket in tickets:
                 for field in fields:
@@ -274,6 +332,9 @@ class SearchMixin:
             raise ZendeskValidationError("Threshold must be between 0.0 and 1.0")
 
         try:
+            # The search term is the same for every ticket, so prepare it once
+            term = search_term.lower()
+            term_words = frozenset(term.split())
             filtered_tickets = []
             for ticket in tickets:
                 best_match_score = 0.0
@@ -283,7 +344,7 @@ class SearchMixin:
                 for field in fields:
                     field_value = ticket.get(field, '')
                     if field_value:
-                        similarity = self._calculate_subject_similarity(search_term, str(field_value))
+                        similarity = _word_similarity(term, term_words, str(field_value).lower())
                         if similarity > best_match_score:
                             best_match_score = similarity
                             best_match_field = field
@@ -398,33 +459,7 @@ class SearchMixin:
 
         # Convert to lowercase for comparison
         s1 = subject1.lower()
-        s2 = subject2.lower()
-
-        # Exact match
-        if s1 == s2:
-            return 1.0
-
-        # Extract words from both subjects
-        words1 = set(s1.split())
-        words2 = set(s2.split())
-
-        if not words1 or not words2:
-            return 0.0
-
-        # Calculate Jaccard similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-
-        if union == 0:
-            return 0.0
-
-        similarity = intersection / union
-
-        # Boost score if one subject contains the other
-        if s1 in s2 or s2 in s1:
-            similarity = min(1.0, similarity + 0.2)
-
-        return similarity
+        return _word_similarity(s1, frozenset(s1.split()), subject2.lower())
 
     def search_tickets_enhanced(
         self,
@@ -781,29 +816,11 @@ class SearchMixin:
         try:
             # Handle relative periods
             if range_type == "relative" and relative_period:
-                now = datetime.now()
-                if relative_period == "last_7_days":
-                    start_date = (now - timedelta(days=7)).strftime('%Y-%m-%d')
-                    end_date = now.strftime('%Y-%m-%d')
-                elif relative_period == "last_30_days":
-                    start_date = (now - timedelta(days=30)).strftime('%Y-%m-%d')
-                    end_date = now.strftime('%Y-%m-%d')
-                elif relative_period == "this_month":
-                    start_date = now.replace(day=1).strftime('%Y-%m-%d')
-                    end_date = now.strftime('%Y-%m-%d')
-                elif relative_period == "last_month":
-                    last_month = now.replace(day=1) - timedelta(days=1)
-                    start_date = last_month.replace(day=1).strftime('%Y-%m-%d')
-                    end_date = last_month.strftime('%Y-%m-%d')
-                elif relative_period == "this_quarter":
-                    quarter_start = now.replace(month=((now.month-1)//3)*3+1, day=1)
-                    start_date = quarter_start.strftime('%Y-%m-%d')
-                    end_date = now.strftime('%Y-%m-%d')
-                elif relative_period == "last_quarter":
-                    quarter_start = now.replace(month=((now.month-1)//3)*3+1, day=1)
-                    last_quarter_start = quarter_start - timedelta(days=90)
-                    start_date = last_quarter_start.strftime('%Y-%m-%d')
-                    end_date = quarter_start.strftime('%Y-%m-%d')
+                period_range = _RELATIVE_PERIODS.get(relative_period)
+                if period_range is not None:
+                    start_dt, end_dt = period_range(datetime.now())
+                    start_date = start_dt.strftime('%Y-%m-%d')
+                    end_date = end_dt.strftime('%Y-%m-%d')
 
             # Build query
             query_parts = []
@@ -1120,8 +1137,9 @@ class SearchMixin:
             field_id = filter_by_custom_field.get('field_id')
             field_value = filter_by_custom_field.get('value')
             if field_id and field_value:
+                expected_value = str(field_value)
                 tickets = [t for t in tickets if any(
-                    cf.get('id') == field_id and str(cf.get('value')) == str(field_value)
+                    cf.get('id') == field_id and str(cf.get('value')) == expected_value
                     for cf in (t.get('custom_fields') or [])
                 )]
 
@@ -1228,6 +1246,22 @@ class SearchMixin:
         total_tickets = 0
         assigned_tickets = 0
 
+        # Resolve metric and grouping options once rather than scanning the
+        # option lists for every ticket
+        metric_set_opts = frozenset(include_metrics)
+        want_channels = 'channels' in metric_set_opts
+        want_forms = 'forms' in metric_set_opts
+        want_response_times = 'response_times' in metric_set_opts
+        want_resolution_times = 'resolution_times' in metric_set_opts
+        want_assignments = 'assignments' in metric_set_opts
+        want_status_transitions = 'status_transitions' in metric_set_opts
+        want_sla = 'first_response_sla' in metric_set_opts
+        want_csat_survey = 'csat_survey' in metric_set_opts
+        want_satisfaction = want_csat_survey or 'satisfaction' in metric_set_opts
+        group_dims = frozenset(group_by or ())
+        # Tickets cluster on a limited number of days, so bucket keys are built once per date
+        bucket_keys: Dict[date, tuple[str, str, str]] = {}
+
         for ticket in tickets:
             created_at = ticket.get("created_at")
             if not created_at:
@@ -1294,10 +1328,15 @@ class SearchMixin:
                     continue
 
             # Time bucket keys
-            iso_year, iso_week, _ = created_date.isocalendar()
-            week_key = f"{iso_year}-W{iso_week:02d}"
-            month_key = f"{created_date.year}-{created_date.month:02d}"
-            day_key = created_date.isoformat()
+            keys = bucket_keys.get(created_date)
+            if keys is None:
+                iso_year, iso_week, _ = created_date.isocalendar()
+                keys = bucket_keys[created_date] = (
+                    f"{iso_year}-W{iso_week:02d}",
+                    f"{created_date.year}-{created_date.month:02d}",
+                    created_date.isoformat(),
+                )
+            week_key, month_key, day_key = keys
 
             # Basic counts
             weekly_counts[week_key] += 1
@@ -1322,33 +1361,33 @@ class SearchMixin:
                 assigned_tickets += 1
 
             # Channel/source metrics
-            if 'channels' in include_metrics:
+            if want_channels:
                 via = ticket.get("via")
                 if via and via.get("channel"):
                     channel = via.get("channel")
                     channel_counts[channel] += 1
-                    if 'channel' in (group_by or []):
+                    if 'channel' in group_dims:
                         grouped_counts['channel'][channel] = grouped_counts['channel'].get(channel, 0) + 1
 
             # Form metrics
-            if 'forms' in include_metrics:
+            if want_forms:
                 form_id = ticket.get("ticket_form_id")
                 if form_id:
                     form_counts[form_id] += 1
-                    if 'form' in (group_by or []):
+                    if 'form' in group_dims:
                         grouped_counts['form'][str(form_id)] = grouped_counts['form'].get(str(form_id), 0) + 1
 
             # Group metrics
             group_id = ticket.get("group_id")
             if group_id:
                 group_counts[group_id] += 1
-                if 'group_id' in (group_by or []):
+                if 'group_id' in group_dims:
                     grouped_counts['group_id'][str(group_id)] = grouped_counts['group_id'].get(str(group_id), 0) + 1
 
             # Time-based metrics
             metrics = ticket.get("metrics", {})
             if metrics:
-                if 'response_times' in include_metrics:
+                if want_response_times:
                     reply_time = metrics.get("reply_time_in_seconds")
                     if reply_time is not None:
                         response_times.append(float(reply_time))
@@ -1361,7 +1400,7 @@ class SearchMixin:
                     if requester_wait is not None:
                         requester_wait_times.append(float(requester_wait))
 
-                if 'resolution_times' in include_metrics:
+                if want_resolution_times:
                     first_res = metrics.get("first_resolution_time_in_seconds")
                     if first_res is not None:
                         first_resolution_times.append(float(first_res))
@@ -1374,31 +1413,28 @@ class SearchMixin:
                     if on_hold is not None:
                         on_hold_times.append(float(on_hold))
 
-            # Assignment metrics (basic - would need audits for full history)
-            if 'assignments' in include_metrics and assignee_id:
-                # First assignment time approximation (created to updated)
+            # Created-to-updated span, shared by the assignment and status
+            # approximations below (both would need audits for full history)
+            updated_span = None
+            if (want_assignments and assignee_id) or want_status_transitions:
                 try:
                     updated_dt = datetime.fromisoformat(str(ticket.get("updated_at", "")).replace("Z", "+00:00"))
-                    assignment_duration = (updated_dt - created_dt).total_seconds()
-                    if assignment_duration > 0:
-                        assignment_times.append(assignment_duration)
+                    updated_span = (updated_dt - created_dt).total_seconds()
                 except (ValueError, TypeError):
                     pass
 
-            # Status transition metrics (basic - would need audits for full history)
-            if 'status_transitions' in include_metrics:
+            # Assignment metrics: first assignment time approximation (created to updated)
+            if want_assignments and assignee_id and updated_span is not None and updated_span > 0:
+                assignment_times.append(updated_span)
+
+            # Status transition metrics: time in current status (created to updated)
+            if want_status_transitions:
                 status_transition_counts[status] += 1
-                # Calculate time in current status (created to updated)
-                try:
-                    updated_dt = datetime.fromisoformat(str(ticket.get("updated_at", "")).replace("Z", "+00:00"))
-                    time_in_status_seconds = (updated_dt - created_dt).total_seconds()
-                    if time_in_status_seconds > 0:
-                        time_in_status[status].append(time_in_status_seconds)
-                except (ValueError, TypeError):
-                    pass
+                if updated_span is not None and updated_span > 0:
+                    time_in_status[status].append(updated_span)
 
             # SLA metrics - check first response SLA breach status (full processing)
-            if 'first_response_sla' in include_metrics:
+            if want_sla:
                 # Check metric events for this ticket
                 metric_events = sla_metric_events_map.get(ticket_id, [])
                 if not metric_events and ticket_id:
@@ -1435,7 +1471,7 @@ class SearchMixin:
                     sla_tickets_with_events += 1
 
             # Satisfaction metrics (legacy)
-            if 'satisfaction' in include_metrics or 'csat_survey' in include_metrics:
+            if want_satisfaction:
                 satisfaction = ticket.get("satisfaction_rating")
                 if satisfaction and satisfaction.get("score") is not None:
                     score = satisfaction.get("score")
@@ -1453,7 +1489,7 @@ class SearchMixin:
                         })
 
             # CSAT Survey Responses (new API)
-            if 'csat_survey' in include_metrics:
+            if want_csat_survey:
                 csat_responses = csat_responses_map.get(ticket_id, [])
                 if not csat_responses and ticket_id:
                     # Fallback: fetch per-ticket if not in bulk map
@@ -1487,7 +1523,7 @@ class SearchMixin:
                 for tag in tags:
                     tag_counts[tag] += 1
                     tag_weekly_counts[tag][week_key] += 1
-                    if 'tags' in (group_by or []):
+                    if 'tags' in group_dims:
                         grouped_counts['tags'][tag] = grouped_counts['tags'].get(tag, 0) + 1
 
             # Requester metrics
@@ -1496,7 +1532,7 @@ class SearchMixin:
                 requester_key = str(requester_id)
                 requester_weekly[requester_key][week_key] += 1
                 requester_counts[requester_id] += 1
-                if 'requester' in (group_by or []):
+                if 'requester' in group_dims:
                     grouped_counts['requester'][requester_key] = grouped_counts['requester'].get(requester_key, 0) + 1
 
             # Organization metrics
@@ -1505,7 +1541,7 @@ class SearchMixin:
                 org_key = str(organization_id)
                 organization_weekly[org_key][week_key] += 1
                 organization_counts[organization_id] += 1
-                if 'organization' in (group_by or []):
+                if 'organization' in group_dims:
                     grouped_counts['organization'][org_key] = grouped_counts['organization'].get(org_key, 0) + 1
 
             # Custom field metrics
@@ -1519,16 +1555,16 @@ class SearchMixin:
                         field_value_str = str(field_value)
                         custom_field_counts[field_id_str][field_value_str] += 1
                         custom_field_weekly_counts[field_id_str][field_value_str][week_key] += 1
-                        if 'custom_fields' in (group_by or []):
+                        if 'custom_fields' in group_dims:
                             # Group by field_id:value combination
                             group_key = f"{field_id_str}:{field_value_str}"
                             grouped_counts['custom_fields'][group_key] = grouped_counts['custom_fields'].get(group_key, 0) + 1
 
             # Grouped metrics
-            if group_by:
-                if 'priority' in group_by:
+            if group_dims:
+                if 'priority' in group_dims:
                     grouped_counts['priority'][priority] = grouped_counts['priority'].get(priority, 0) + 1
-                if 'type' in group_by:
+                if 'type' in group_dims:
                     grouped_counts['type'][ticket_type] = grouped_counts['type'].get(ticket_type, 0) + 1
 
         # Helper function to calculate statistics from a list of values
@@ -1,9 +1,10 @@
 """Ticket-related methods for ZendeskClient."""
+import functools
 import json
 import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 from datetime import datetime
 
 from zenpy.lib.api_objects import Comment
@@ -17,7 +18,43 @@ from zendesk_mcp_server.exceptions import (
     ZendeskRateLimitError,
     ZendeskNetworkError,
 )
-from zendesk_mcp_server.client.base import _urlopen_with_retry
+from zendesk_mcp_server.client.base import _fan_out, _urlopen_with_retry
+
+# Zendesk caps /tickets/show_many at 100 ids per request
+SHOW_MANY_BATCH_SIZE = 100
+
+# Largest page the Guide survey responses endpoint serves. Sending page[size]
+# is what opts the endpoint into cursor pagination; without it the API falls
+# back to offset pagination, which is slower and capped at 10,000 records.
+SURVEY_RESPONSES_PAGE_SIZE = 100
+
+# Top-level and answer keys the survey handlers actually read
+SURVEY_RESPONSE_FIELDS = ("id", "created_at", "responder_id", "survey_id", "expires_at", "subjects", "answers")
+_SURVEY_ANSWER_KEYS = ("type", "rating", "value", "text", "rating_category", "category")
+
+
+def _compact_survey_response(resp: Dict[str, Any], fields: Sequence[str] = SURVEY_RESPONSE_FIELDS) -> Dict[str, Any]:
+    """Project a Guide survey response down to the given top-level fields.
+
+    Survey payloads carry large question/answer metadata; dropping it right after
+    decoding keeps buffered pages small while preserving the dict shape. Subjects
+    keep only their zrn and answers only their rating/comment keys.
+    """
+    compact: Dict[str, Any] = {}
+    for field in fields:
+        if field == "subjects":
+            compact["subjects"] = [
+                {"subject_zrn": subj.get("subject_zrn") or subj.get("zrn")}
+                for subj in resp.get("subjects") or []
+            ]
+        elif field == "answers":
+            compact["answers"] = [
+                {key: ans[key] for key in _SURVEY_ANSWER_KEYS if key in ans}
+                for ans in resp.get("answers") or []
+            ]
+        else:
+            compact[field] = resp.get(field)
+    return compact
 
 
 class TicketMixin:
@@ -55,6 +92,45 @@ class TicketMixin:
                 raise
             raise ZendeskAPIError(f"Failed to get ticket {ticket_id}: {str(e)}")
 
+    def show_many_tickets(self, ticket_ids: List[int]) -> Dict[str, Any]:
+        """Fetch several tickets by ID via /tickets/show_many, 100 ids per request.
+
+        Tickets are shaped like get_ticket() results plus custom_fields; ids that
+        don't resolve are simply absent from the result.
+        """
+        try:
+            tickets: List[Dict[str, Any]] = []
+            for i in range(0, len(ticket_ids), SHOW_MANY_BATCH_SIZE):
+                batch = ticket_ids[i:i + SHOW_MANY_BATCH_SIZE]
+                data = self._get_json(
+                    "/tickets/show_many.json",
+                    {"ids": ",".join(str(tid) for tid in batch)},
+                )
+                for t in data.get('tickets', []):
+                    satisfaction = t.get('satisfaction_rating')
+                    tickets.append({
+                        'id': t.get('id'),
+                        'subject': t.get('subject'),
+                        'description': t.get('description'),
+                        'status': t.get('status'),
+                        'priority': t.get('priority'),
+                        'created_at': t.get('created_at'),
+                        'updated_at': t.get('updated_at'),
+                        'requester_id': t.get('requester_id'),
+                        'assignee_id': t.get('assignee_id'),
+                        'organization_id': t.get('organization_id'),
+                        'satisfaction_rating': {
+                            'score': satisfaction.get('score'),
+                            'comment': satisfaction.get('comment'),
+                        } if satisfaction else None,
+                        'custom_fields': t.get('custom_fields', []),
+                    })
+            return {'tickets': tickets, 'count': len(tickets)}
+        except Exception as e:
+            if isinstance(e, ZendeskError):
+                raise
+            raise ZendeskAPIError(f"Failed to fetch tickets {ticket_ids}: {str(e)}")
+
     def get_ticket_comments(self, ticket_id: int) -> List[Dict[str, Any]]:
         """Get all comments for a specific ticket."""
         try:
@@ -145,6 +221,26 @@ class TicketMixin:
                 raise
             raise ZendeskAPIError(f"Failed to get metric events for ticket {ticket_id}: {str(e)}")
 
+    async def get_ticket_metric_events_async(self, ticket_id: int) -> Dict[str, Any]:
+        """Async variant of get_ticket_metric_events over the shared async HTTP client."""
+        try:
+            metric_events: List[Dict[str, Any]] = []
+            url = f"{self.base_url}/tickets/{ticket_id}/metric_events.json"
+            while url:
+                data = await self._get_json_url_async(url)
+                metric_events.extend(data.get('metric_events') or [])
+                url = data.get('next_page')
+
+            return {
+                'metric_events': metric_events,
+                'count': len(metric_events),
+                'has_more': False,
+            }
+        except Exception as e:
+            if isinstance(e, ZendeskError):
+                raise
+            raise ZendeskAPIError(f"Failed to get metric events for ticket {ticket_id}: {str(e)}")
+
     def incremental_ticket_metric_events(
         self,
         start_time: int | datetime,
@@ -261,6 +357,50 @@ class TicketMixin:
             if isinstance(e, ZendeskError):
                 raise
             raise ZendeskAPIError(f"Failed to search CSAT survey responses: {str(e)}")
+    @staticmethod
+    def _survey_responses_params(
+        created_at_start_ms: int | None,
+        created_at_end_ms: int | None,
+        subject_ticket_ids: List[int] | None,
+        responder_ids: List[int] | None,
+        cursor: str | None,
+        page_size: int,
+    ) -> Dict[str, Any]:
+        """Build the query string for GET /guide/survey_responses."""
+        params: Dict[str, Any] = {"page[size]": str(page_size)}
+        if created_at_start_ms is not None:
+            params["filter[created_at_start]"] = str(created_at_start_ms)
+        if created_at_end_ms is not None:
+            params["filter[created_at_end]"] = str(created_at_end_ms)
+        if subject_ticket_ids:
+            zrns = [f"zen:ticket:{int(tid)}" for tid in subject_ticket_ids if tid is not None]
+            if zrns:
+                params["filter[subject_zrns]"] = ",".join(zrns)
+        if responder_ids:
+            params["filter[responder_ids]"] = ",".join(str(int(rid)) for rid in responder_ids if rid is not None)
+        if cursor:
+            params["page[after]"] = cursor
+        return params
+
+    @staticmethod
+    def _survey_responses_result(
+        data: Dict[str, Any],
+        compact: bool,
+        fields: Sequence[str] | None,
+    ) -> Dict[str, Any]:
+        """Shape a raw survey responses page, applying the compact/fields projection."""
+        # Ensure expected structure
+        survey_responses = data.get("survey_responses") or []
+        if fields is not None:
+            survey_responses = [_compact_survey_response(r, fields) for r in survey_responses]
+        elif compact:
+            survey_responses = [_compact_survey_response(r) for r in survey_responses]
+        meta = data.get("meta") or {}
+        return {
+            "survey_responses": survey_responses,
+            "meta": meta,
+        }
+
     def list_survey_responses_guide(
         self,
         created_at_start_ms: int | None = None,
@@ -268,36 +408,49 @@ class TicketMixin:
         subject_ticket_ids: List[int] | None = None,
         responder_ids: List[int] | None = None,
         cursor: str | None = None,
+        compact: bool = False,
+        page_size: int = SURVEY_RESPONSES_PAGE_SIZE,
+        fields: Sequence[str] | None = None,
     ) -> Dict[str, Any]:
         """Call Zendesk Guide CSAT Survey Responses API.
 
-        Wraps GET /api/v2/guide/survey_responses with supported filters.
+        Wraps GET /api/v2/guide/survey_responses with supported filters, using cursor
+        pagination (page[size], page[after]); follow meta.has_more / meta.after_cursor.
         Returns raw response with keys: 'survey_responses' and 'meta'.
+        With compact=True each response is reduced to id, created_at, responder_id,
+        survey_id, expires_at, subjects[].subject_zrn and the rating/comment
+        fields of answers[]; fields narrows that projection to the given top-level
+        keys (the endpoint has no server-side sparse fieldsets).
         """
         try:
-            params: Dict[str, Any] = {}
-            if created_at_start_ms is not None:
-                params["filter[created_at_start]"] = str(created_at_start_ms)
-            if created_at_end_ms is not None:
-                params["filter[created_at_end]"] = str(created_at_end_ms)
-            if subject_ticket_ids:
-                zrns = [f"zen:ticket:{int(tid)}" for tid in subject_ticket_ids if tid is not None]
-                if zrns:
-                    params["filter[subject_zrns]"] = ",".join(zrns)
-            if responder_ids:
-                params["filter[responder_ids]"] = ",".join(str(int(rid)) for rid in responder_ids if rid is not None)
-            if cursor:
-                params["page[after]"] = cursor
-
-            # Perform request
+            params = self._survey_responses_params(
+                created_at_start_ms, created_at_end_ms, subject_ticket_ids, responder_ids, cursor, page_size
+            )
             data = self._get_json("/guide/survey_responses", params=params)
-            # Ensure expected structure
-            survey_responses = data.get("survey_responses") or []
-            meta = data.get("meta") or {}
-            return {
-                "survey_responses": survey_responses,
-                "meta": meta,
-            }
+            return self._survey_responses_result(data, compact, fields)
+        except Exception as e:
+            if isinstance(e, ZendeskError):
+                raise
+            raise ZendeskAPIError(f"Failed to list survey responses: {str(e)}")
+
+    async def list_survey_responses_guide_async(
+        self,
+        created_at_start_ms: int | None = None,
+        created_at_end_ms: int | None = None,
+        subject_ticket_ids: List[int] | None = None,
+        responder_ids: List[int] | None = None,
+        cursor: str | None = None,
+        compact: bool = False,
+        page_size: int = SURVEY_RESPONSES_PAGE_SIZE,
+        fields: Sequence[str] | None = None,
+    ) -> Dict[str, Any]:
+        """Async variant of list_survey_responses_guide over the shared async HTTP client."""
+        try:
+            params = self._survey_responses_params(
+                created_at_start_ms, created_at_end_ms, subject_ticket_ids, responder_ids, cursor, page_size
+            )
+            data = await self._get_json_async("/guide/survey_responses", params=params)
+            return self._survey_responses_result(data, compact, fields)
         except Exception as e:
             if isinstance(e, ZendeskError):
                 raise
@@ -637,17 +790,29 @@ class TicketMixin:
         # Core ticket (raise if not found)
         ticket = self.get_ticket(ticket_id)
 
-        # Comments and audits with limits
-        comments_res = self._get_ticket_comments_with_attachments(ticket_id, limit=comment_limit)
-        audits_res = self.get_ticket_audits(ticket_id, limit=audit_limit)
+        # Comments and audits with limits, plus user/org context (best effort).
+        # None of these depend on each other, so they are fetched concurrently.
+        calls = {
+            'comments': functools.partial(self._get_ticket_comments_with_attachments, ticket_id, limit=comment_limit),
+            'audits': functools.partial(self.get_ticket_audits, ticket_id, limit=audit_limit),
+        }
+        if ticket.get('requester_id'):
+            calls['requester'] = functools.partial(self._get_user, ticket['requester_id'])
+        if ticket.get('assignee_id'):
+            calls['assignee'] = functools.partial(self._get_user, ticket['assignee_id'])
+        if ticket.get('organization_id'):
+            calls['organization'] = functools.partial(self._get_organization, ticket['organization_id'])
+        pending = _fan_out(calls)
+
+        comments_res = pending['comments'].result()
+        audits_res = pending['audits'].result()
 
         comments = comments_res['comments']
         audits = audits_res['audits']
 
-        # User/org context (best effort)
-        requester = self._get_user(ticket.get('requester_id')) if ticket.get('requester_id') else None
-        assignee = self._get_user(ticket.get('assignee_id')) if ticket.get('assignee_id') else None
-        organization = self._get_organization(ticket.get('organization_id')) if ticket.get('organization_id') else None
+        requester = pending['requester'].result() if 'requester' in pending else None
+        assignee = pending['assignee'].result() if 'assignee' in pending else None
+        organization = pending['organization'].result() if 'organization' in pending else None
 
         # Build timeline from audits (field changes) and comments
         timeline: List[Dict[str, Any]] = []
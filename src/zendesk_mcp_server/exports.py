@@ -0,0 +1,96 @@
+"""Bulk tool results kept on disk and served as zendesk://exports/<id> resources."""
+import json
+import os
+import re
+import time
+import uuid
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup for large payloads
+    orjson = None
+
+# Where search_tickets_export keeps JSON Lines results when asked for a resource
+EXPORT_OUTPUT_DIR = os.path.expanduser(os.getenv("ZENDESK_MCP_EXPORT_DIR") or "~/.zendesk-mcp/exports")
+# Seconds an export stays readable before it is pruned
+EXPORT_RETENTION_SECONDS = float(os.getenv("ZENDESK_MCP_EXPORT_TTL_SECONDS", "3600"))
+# Most exports kept on disk at once; the oldest are pruned first
+EXPORT_MAX_FILES = int(os.getenv("ZENDESK_MCP_EXPORT_MAX_FILES", "20"))
+
+EXPORT_URI_PREFIX = "zendesk://exports/"
+_EXPORT_ID_RE = re.compile(r"[0-9a-f]{32}")
+_SUFFIX = ".jsonl"
+
+
+def export_uri(export_id: str) -> str:
+    """Return the resource URI of an export."""
+    return EXPORT_URI_PREFIX + export_id
+
+
+def _export_path(export_id: str) -> str:
+    if not _EXPORT_ID_RE.fullmatch(export_id):
+        raise ValueError(f"Unknown export: {export_id}")
+    return os.path.join(EXPORT_OUTPUT_DIR, export_id + _SUFFIX)
+
+
+def list_exports() -> list[str]:
+    """Return the ids of exports currently on disk, newest first."""
+    try:
+        entries = [e for e in os.scandir(EXPORT_OUTPUT_DIR) if e.name.endswith(_SUFFIX)]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [e.name[:-len(_SUFFIX)] for e in entries if _EXPORT_ID_RE.fullmatch(e.name[:-len(_SUFFIX)])]
+
+
+def prune_exports(keep: int | None = None) -> None:
+    """Delete exports past EXPORT_RETENTION_SECONDS and all but the newest ``keep`` (default EXPORT_MAX_FILES)."""
+    if keep is None:
+        keep = EXPORT_MAX_FILES
+    cutoff = time.time() - EXPORT_RETENTION_SECONDS
+    for index, export_id in enumerate(list_exports()):
+        path = _export_path(export_id)
+        try:
+            if index >= keep or os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def write_export(rows: list[dict[str, Any]]) -> str:
+    """Write rows as JSON Lines under a fresh id and return the id.
+
+    Rows go to a temporary file that is renamed into place, so readers never
+    see a partial export; older exports are pruned to make room.
+    """
+    os.makedirs(EXPORT_OUTPUT_DIR, exist_ok=True)
+    prune_exports(keep=max(EXPORT_MAX_FILES - 1, 0))
+    export_id = uuid.uuid4().hex
+    path = _export_path(export_id)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for row in rows:
+                f.write(orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS) if orjson is not None else json.dumps(row).encode())
+                f.write(b"\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return export_id
+
+
+def read_export(export_id: str) -> str:
+    """Return the JSON Lines body of an export, or raise ValueError if it is gone."""
+    path = _export_path(export_id)
+    try:
+        if time.time() - os.path.getmtime(path) > EXPORT_RETENTION_SECONDS:
+            raise ValueError(f"Export expired: {export_id}")
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        raise ValueError(f"Unknown export: {export_id}")
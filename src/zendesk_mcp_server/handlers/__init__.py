@@ -31,6 +31,7 @@ TOOL_HANDLERS = {
     "search_by_tags_advanced": tools.handle_search_by_tags_advanced,
     "batch_search_tickets": tools.handle_batch_search_tickets,
     "get_ticket_bundle_zendesk": tools.handle_get_ticket_bundle_zendesk,
+    "get_ticket_context": tools.handle_get_ticket_context,
     "get_case_volume_analytics": tools.handle_get_case_volume_analytics,
     "get_ticket_sla_status": tools.handle_get_ticket_sla_status,
     "search_tickets_by_csat": tools.handle_search_tickets_by_csat,
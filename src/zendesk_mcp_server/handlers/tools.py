@@ -1,82 +1,573 @@
-"""Individual tool handler functions."""
+"""Individual tool handler functions.
+
+Handlers receive the shared client from server.get_zendesk_client(); it holds a
+pooled keep-alive HTTP session, so handlers must never close or recreate it.
+"""
+import asyncio
+import functools
 import json
-from typing import Any
+import os
+import re
+import weakref
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, NamedTuple
+from cachetools import TTLCache
 from mcp.server import types
 
+try:
+    import orjson
+except ImportError:  # optional speedup for large payloads
+    orjson = None
+
+from zendesk_mcp_server.client.tickets import SURVEY_RESPONSES_PAGE_SIZE
+from zendesk_mcp_server.exports import export_uri, write_export
+from zendesk_mcp_server.json_utils import json_raw
 from zendesk_mcp_server.server import run_client_call
 
+# Hard cap on survey-response pages walked by a single tool call
+SURVEY_PAGE_LIMIT = 1000
+# Maximum number of per-ticket API calls allowed in flight at once
+TICKET_FETCH_CONCURRENCY = 10
+# Number of search results examined per concurrent batch in the legacy CSAT path
+CSAT_TICKET_WINDOW = 50
+# Seconds get_ticket calls wait for others to share a show_many request while one is in flight
+TICKET_BATCH_WINDOW = 0.02
+# Tickets per TextContent item when a large result is split across several items
+RESPONSE_CHUNK_SIZE = 1000
+# Per-bucket series of get_case_volume_analytics, split out when a long range makes them large
+ANALYTICS_SERIES_KEYS = ("time_series", "weekly_counts", "monthly_counts", "daily_counts", "technician_weekly_counts")
+# Tickets echoed inline alongside an export written to a resource
+EXPORT_PREVIEW_SIZE = 5
+# Number of created_at shards counted concurrently by count_survey_responses_zendesk
+SURVEY_COUNT_SHARDS = 4
+
+# Seconds to reuse responses of rarely-changing endpoints (SLA policies, ticket
+# fields, KB sections and articles); 0 disables the cache.
+STATIC_CACHE_TTL_SECONDS = float(os.getenv("ZENDESK_MCP_STATIC_TTL_SECONDS", "300"))
+# Serialized responses keyed by (tool name, args)
+_STATIC_CACHE: TTLCache = TTLCache(maxsize=512, ttl=STATIC_CACHE_TTL_SECONDS)
+# Seconds get_ticket may serve a ticket it fetched recently; kept short because
+# tickets change often. Updates and comments made through this server evict
+# the ticket. 0 disables the cache.
+TICKET_CACHE_TTL_SECONDS = float(os.getenv("ZENDESK_MCP_TICKET_TTL_SECONDS", "30"))
+_TICKET_CACHE: TTLCache = TTLCache(maxsize=256, ttl=TICKET_CACHE_TTL_SECONDS)
+# get_ticket_comments responses keyed by (ticket_id, updated_at). Consulted only
+# while the ticket is in _TICKET_CACHE; a new comment bumps updated_at, so once
+# the ticket is refetched the old entry is never hit again.
+_COMMENTS_CACHE: TTLCache = TTLCache(maxsize=256, ttl=STATIC_CACHE_TTL_SECONDS)
+# Seconds read-only search and analytics tools reuse a response for identical
+# arguments, so polling callers don't repeat the same aggregation; 0 disables.
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("ZENDESK_MCP_SEARCH_TTL_SECONDS", "60"))
+# Responses keyed by (tool name, canonical args), plus the computations in flight
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=512, ttl=SEARCH_CACHE_TTL_SECONDS)
+_SEARCH_INFLIGHT: dict[tuple[str, bytes], asyncio.Future] = {}
+
+# Offset from midnight to the last millisecond of the same day
+_EOD = timedelta(days=1, milliseconds=-1)
+
+# Survey subject ZRNs, e.g. "zen:ticket:123" / "zen:organization:456"
+_TICKET_ZRN_RE = re.compile(r"^zen:ticket:(\d+)$")
+_SUBJECT_ZRN_RE = re.compile(r"^zen:(ticket|organization):(\d+)$")
+_NON_WS_RE = re.compile(r"\S")
+
+# Legacy satisfaction ratings are 'good'/'bad' strings: which ones satisfy each
+# csat_score filter, and the numeric score each maps to.
+_STRING_CSAT_MATCH: dict[str, frozenset[str]] = {
+    'low': frozenset({'bad'}),
+    'high': frozenset({'good'}),
+    'any': frozenset({'good', 'bad'}),
+}
+_STRING_CSAT_SCORE: dict[str, int] = {'bad': 2, 'good': 5}
+
+# Per-tool keyword defaults for handlers that forward optional arguments straight
+# to a client method. Keys double as the allow-list of forwarded arguments.
+_SEARCH_DEFAULTS: dict[str, Any] = {"sort_by": None, "sort_order": None}
+
+_DEFAULTS: dict[str, dict[str, Any]] = {
+    "search_tickets": {"query": None, **_SEARCH_DEFAULTS, "limit": 100},
+    "search_tickets_export": {"query": None, **_SEARCH_DEFAULTS, "max_results": None},
+    "search_by_source": {"channel": None, **_SEARCH_DEFAULTS, "limit": 100},
+    "search_tickets_enhanced": {
+        "query": None,
+        "regex_pattern": None,
+        "fuzzy_term": None,
+        "fuzzy_threshold": 0.7,
+        "proximity_terms": None,
+        "proximity_distance": 5,
+        **_SEARCH_DEFAULTS,
+        "limit": 100,
+    },
+    "get_search_statistics": {"query": None, **_SEARCH_DEFAULTS, "limit": 1000},
+    "batch_search_tickets": {
+        "queries": None,
+        "deduplicate": True,
+        **_SEARCH_DEFAULTS,
+        "limit_per_query": 100,
+    },
+    "get_tickets": {
+        "page": 1,
+        "per_page": 25,
+        "sort_by": "created_at",
+        "sort_order": "desc",
+    },
+    "build_search_query": {
+        "status": None,
+        "priority": None,
+        "assignee": None,
+        "requester": None,
+        "organization": None,
+        "tags": None,
+        "tags_logic": "OR",
+        "exclude_tags": None,
+        "created_after": None,
+        "created_before": None,
+        "updated_after": None,
+        "updated_before": None,
+        "solved_after": None,
+        "solved_before": None,
+        "due_after": None,
+        "due_before": None,
+        "custom_fields": None,
+        "subject_contains": None,
+        "description_contains": None,
+        "comment_contains": None,
+    },
+    "search_by_date_range": {
+        "date_field": "created",
+        "range_type": "custom",
+        "start_date": None,
+        "end_date": None,
+        "relative_period": None,
+        "sort_by": None,
+        "sort_order": None,
+        "limit": 100,
+    },
+    "search_by_tags_advanced": {
+        "include_tags": None,
+        "exclude_tags": None,
+        "tag_logic": "OR",
+        "sort_by": None,
+        "sort_order": None,
+        "limit": 100,
+    },
+    "get_case_volume_analytics": {
+        "start_date": None,
+        "end_date": None,
+        "max_results": None,
+        "include_metrics": None,
+        "group_by": None,
+        "filter_by_status": None,
+        "filter_by_priority": None,
+        "filter_by_tags": None,
+        "filter_by_csat_score": None,
+        "filter_by_sla_breach": None,
+        "filter_by_organization_id": None,
+        "filter_by_custom_field": None,
+        "time_bucket": "weekly",
+    },
+    "search_tickets_with_sla_breaches": {
+        "breach_type": None,
+        "status": None,
+        "priority": None,
+        "limit": 100,
+    },
+    "get_tickets_at_risk_of_breach": {
+        "status": None,
+        "priority": None,
+        "limit": 50,
+    },
+    "get_recent_tickets_with_csat": {
+        "limit": 20,
+    },
+}
+
 
 def _json_response(data: Any) -> list[types.TextContent]:
     """Helper to format JSON response."""
-    return [types.TextContent(type="text", text=json.dumps(data, indent=2))]
+    return [types.TextContent(type="text", text=json_raw(data).decode())]
+
+
+def _json_chunked_response(data: dict[str, Any], *keys: str) -> list[types.TextContent]:
+    """Helper to split a large response across several TextContent items.
+
+    The first item is ``data`` without ``keys`` plus a ``chunks`` count. Each
+    following item is a JSON object holding one slice of a ``keys`` entry: lists
+    are sliced every RESPONSE_CHUNK_SIZE items and dicts are sent one entry per
+    item, so no single multi-megabyte string has to be built.
+    """
+    head = {k: v for k, v in data.items() if k not in keys}
+    chunks: list[dict[str, Any]] = []
+    for key in keys:
+        value = data.get(key)
+        if isinstance(value, dict):
+            chunks.extend({key: {name: entry}} for name, entry in value.items())
+        elif value:
+            chunks.extend(
+                {key: value[start:start + RESPONSE_CHUNK_SIZE]}
+                for start in range(0, len(value), RESPONSE_CHUNK_SIZE)
+            )
+    head["chunks"] = len(chunks)
+    return [types.TextContent(type="text", text=json_raw(part).decode()) for part in (head, *chunks)]
+
+
+async def _cached_json_response(key: tuple[Any, ...], func: Any, *args: Any) -> list[types.TextContent]:
+    """Helper to serve a rarely-changing endpoint from the static TTL cache.
+
+    The serialized JSON text is cached, so both the API call and serialization
+    are skipped on a hit.
+    """
+    text = _STATIC_CACHE.get(key) if STATIC_CACHE_TTL_SECONDS > 0 else None
+    if text is None:
+        result = await run_client_call(func, *args)
+        text = json_raw(result).decode()
+        if STATIC_CACHE_TTL_SECONDS > 0:
+            _STATIC_CACHE[key] = text
+    return [types.TextContent(type="text", text=text)]
+
+
+def _args_key(arguments: dict[str, Any] | None) -> bytes:
+    """Helper to turn tool arguments into a canonical, hashable cache key."""
+    if orjson is not None:
+        return orjson.dumps(arguments or {}, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(arguments or {}, sort_keys=True, default=str).encode()
+
+
+def _search_cached(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator serving a read-only tool from _SEARCH_CACHE for identical arguments.
+
+    Concurrent calls with the same arguments share one in-flight computation;
+    failures are not cached.
+    """
+    name = handler.__name__.removeprefix("handle_")
+
+    @functools.wraps(handler)
+    async def wrapper(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
+        if SEARCH_CACHE_TTL_SECONDS <= 0:
+            return await handler(client, arguments)
+        key = (name, _args_key(arguments))
+        cached = _SEARCH_CACHE.get(key)
+        if cached is not None:
+            return cached
+        future = _SEARCH_INFLIGHT.get(key)
+        if future is None:
+            future = _SEARCH_INFLIGHT[key] = asyncio.ensure_future(handler(client, arguments))
+            future.add_done_callback(lambda f: _SEARCH_INFLIGHT.pop(key, None))
+        # Shielded so one caller going away doesn't cancel the others' result
+        result = await asyncio.shield(future)
+        _SEARCH_CACHE[key] = result
+        return result
+
+    return wrapper
+
+
+async def _gather_bounded(func: Any, items: list[Any], limit: int = TICKET_FETCH_CONCURRENCY) -> list[Any]:
+    """Helper to call ``func(item)`` for each item concurrently, at most ``limit`` at a time.
+
+    Results are returned in input order; failed calls yield ``None``.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _call(item: Any) -> Any:
+        async with semaphore:
+            try:
+                return await run_client_call(func, item)
+            except Exception:
+                return None
+
+    return await asyncio.gather(*(_call(item) for item in items))
+
+
+class _TicketBatcher:
+    """Coalesce concurrent get_ticket calls into one show_many request.
+
+    With nothing else in flight an id is sent straight to client.get_ticket, so
+    a lone call pays no batching delay. Calls that arrive while a fetch is
+    running wait up to TICKET_BATCH_WINDOW for company and go out together. A
+    batch of one still goes through client.get_ticket, and ids show_many doesn't
+    return are retried the same way so callers see the usual per-ticket error.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self._pending: dict[int, list[asyncio.Future]] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._in_flight = 0
+
+    async def get(self, ticket_id: int) -> dict[str, Any]:
+        if not self._in_flight and self._flush_task is None:
+            self._in_flight += 1
+            try:
+                return await run_client_call(self._client.get_ticket, ticket_id)
+            finally:
+                self._in_flight -= 1
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(ticket_id, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(TICKET_BATCH_WINDOW)
+        pending, self._pending, self._flush_task = self._pending, {}, None
+        self._in_flight += 1
+        try:
+            await self._fetch(pending)
+        finally:
+            self._in_flight -= 1
+
+    async def _fetch(self, pending: dict[int, list[asyncio.Future]]) -> None:
+        by_id: dict[int, dict[str, Any]] = {}
+        if len(pending) > 1:
+            try:
+                result = await run_client_call(self._client.show_many_tickets, list(pending))
+                for ticket in result.get("tickets", []):
+                    ticket.pop("custom_fields", None)  # keep the get_ticket shape
+                    by_id[ticket["id"]] = ticket
+            except Exception:
+                pass  # fall back to per-ticket fetches below
+
+        async def resolve(ticket_id: int, futures: list[asyncio.Future]) -> None:
+            try:
+                ticket = by_id.get(ticket_id)
+                if ticket is None:
+                    ticket = await run_client_call(self._client.get_ticket, ticket_id)
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for future in futures:
+                if not future.done():
+                    future.set_result(ticket)
+
+        await asyncio.gather(*(resolve(ticket_id, futures) for ticket_id, futures in pending.items()))
+
+
+# One batcher per client instance
+_TICKET_BATCHERS: "weakref.WeakKeyDictionary[Any, _TicketBatcher]" = weakref.WeakKeyDictionary()
+
+
+def _ticket_batcher(client: Any) -> _TicketBatcher:
+    batcher = _TICKET_BATCHERS.get(client)
+    if batcher is None:
+        batcher = _TICKET_BATCHERS[client] = _TicketBatcher(client)
+    return batcher
+
+
+class _PageBudget:
+    """Survey-response pages one tool call may still fetch, shared by all of its walks.
+
+    ``exhausted`` is set once a walk wanted another page after the budget ran out,
+    i.e. the results are incomplete.
+    """
+
+    __slots__ = ("remaining", "exhausted")
+
+    def __init__(self, pages: int = SURVEY_PAGE_LIMIT) -> None:
+        self.remaining = pages
+        self.exhausted = False
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            self.exhausted = True
+            return False
+        self.remaining -= 1
+        return True
+
+
+async def _iter_survey_pages(
+    client: Any,
+    cursor: str | None = None,
+    budget: _PageBudget | None = None,
+    **params: Any,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Helper to yield Guide survey-response pages, prefetching one page ahead.
+
+    A producer task fetches page K+1 while the caller processes page K. Iteration
+    stops on the last page, an empty page, a missing or repeated cursor, or once
+    ``budget`` (default: SURVEY_PAGE_LIMIT pages for this walk alone) runs out.
+    Wrap in ``contextlib.aclosing`` so breaking out early cancels the in-flight
+    prefetch.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    if budget is None:
+        budget = _PageBudget(SURVEY_PAGE_LIMIT)
+
+    async def produce() -> None:
+        page_cursor = cursor
+        try:
+            while budget.take():
+                raw = await client.list_survey_responses_guide_async(cursor=page_cursor, **params)
+                survey_responses = raw.get("survey_responses", [])
+                if not survey_responses:
+                    break
+                await queue.put(survey_responses)
+                meta = raw.get("meta", {})
+                if not meta.get("has_more"):
+                    break
+                prev_cursor = page_cursor
+                page_cursor = meta.get("after_cursor") or meta.get("after")
+                if not page_cursor or page_cursor == prev_cursor:
+                    break
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def _fetch_tickets(client: Any, ticket_ids: list[int]) -> list[dict[str, Any] | None]:
+    """Helper to fetch tickets in input order, None for any that can't be loaded.
+
+    Prefers the client's bulk show_many endpoint (one request per 100 ids) and
+    falls back to bounded concurrent get_ticket calls.
+    """
+    if not ticket_ids:
+        return []
+    show_many = getattr(client, "show_many_tickets", None)
+    if show_many is not None:
+        try:
+            bulk = await run_client_call(show_many, ticket_ids)
+        except Exception:
+            bulk = None
+        if bulk is not None:
+            by_id = {t.get("id"): t for t in bulk.get("tickets", [])}
+            return [by_id.get(tid) for tid in ticket_ids]
+    return await _gather_bounded(client.get_ticket, ticket_ids)
+
+
+def _merge_args(tool_name: str, arguments: dict[str, Any] | None) -> dict[str, Any]:
+    """Helper to overlay tool arguments on the tool's defaults, dropping unknown keys."""
+    defaults = _DEFAULTS[tool_name]
+    if not arguments:
+        return dict(defaults)
+    return {**defaults, **{key: arguments[key] for key in arguments.keys() & defaults.keys()}}
 
 
 def _require_args(arguments: dict[str, Any] | None, *required_keys: str) -> None:
-    """Helper to validate required arguments."""
+    """Helper to validate required arguments.
+
+    The common all-present case does one dict lookup per key and allocates nothing.
+    """
     if not arguments:
         raise ValueError("Missing arguments")
-    missing = [key for key in required_keys if key not in arguments or arguments[key] is None]
-    if missing:
-        raise ValueError(f"Missing required arguments: {', '.join(missing)}")
+    for key in required_keys:
+        if arguments.get(key) is None:
+            missing = [k for k in required_keys if arguments.get(k) is None]
+            raise ValueError(f"Missing required arguments: {', '.join(missing)}")
+
+
+def _extract(
+    arguments: dict[str, Any] | None,
+    required: tuple[str, ...] = (),
+    optional: tuple[tuple[str, Any], ...] = (),
+) -> tuple[Any, ...]:
+    """Helper to validate and pull handler arguments in a single pass.
+
+    Returns the ``required`` values followed by the ``optional`` ``(key, default)``
+    values, in order, so handlers can unpack them directly.
+    """
+    if not arguments:
+        if required:
+            raise ValueError("Missing arguments")
+        return tuple(default for _, default in optional)
+    get = arguments.get
+    values = [get(key) for key in required]
+    for value in values:
+        if value is None:
+            missing = [k for k, v in zip(required, values) if v is None]
+            raise ValueError(f"Missing required arguments: {', '.join(missing)}")
+    values.extend(get(key, default) for key, default in optional)
+    return tuple(values)
+
+
+async def _get_ticket(client: Any, ticket_id: int) -> dict[str, Any]:
+    """Fetch one ticket through the short-lived cache and the show_many batcher."""
+    ticket = _TICKET_CACHE.get(ticket_id) if TICKET_CACHE_TTL_SECONDS > 0 else None
+    if ticket is None:
+        # Concurrent get_ticket calls are coalesced into a single show_many request
+        ticket = await _ticket_batcher(client).get(ticket_id)
+        if TICKET_CACHE_TTL_SECONDS > 0:
+            _TICKET_CACHE[ticket_id] = ticket
+    return ticket
 
 
 async def handle_get_ticket(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_ticket tool."""
     _require_args(arguments, "ticket_id")
-    ticket = await run_client_call(client.get_ticket, arguments["ticket_id"])
-    return _json_response(ticket)
+    return _json_response(await _get_ticket(client, int(arguments["ticket_id"])))
 
 
 async def handle_create_ticket(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle create_ticket tool."""
-    _require_args(arguments, "subject", "description")
+    subject, description, requester_id, assignee_id, priority, ticket_type, tags, custom_fields = _extract(
+        arguments,
+        ("subject", "description"),
+        (("requester_id", None), ("assignee_id", None), ("priority", None),
+         ("type", None), ("tags", None), ("custom_fields", None)),
+    )
     created = await run_client_call(
         client.create_ticket,
-        subject=arguments.get("subject"),
-        description=arguments.get("description"),
-        requester_id=arguments.get("requester_id"),
-        assignee_id=arguments.get("assignee_id"),
-        priority=arguments.get("priority"),
-        type=arguments.get("type"),
-        tags=arguments.get("tags"),
-        custom_fields=arguments.get("custom_fields"),
+        subject=subject,
+        description=description,
+        requester_id=requester_id,
+        assignee_id=assignee_id,
+        priority=priority,
+        type=ticket_type,
+        tags=tags,
+        custom_fields=custom_fields,
     )
     return _json_response({"message": "Ticket created successfully", "ticket": created})
 
 
 async def handle_get_tickets(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_tickets tool."""
-    page = arguments.get("page", 1) if arguments else 1
-    per_page = arguments.get("per_page", 25) if arguments else 25
-    sort_by = arguments.get("sort_by", "created_at") if arguments else "created_at"
-    sort_order = arguments.get("sort_order", "desc") if arguments else "desc"
-    tickets = await run_client_call(
-        client.get_tickets,
-        page=page,
-        per_page=per_page,
-        sort_by=sort_by,
-        sort_order=sort_order
-    )
+    tickets = await run_client_call(client.get_tickets, **_merge_args("get_tickets", arguments))
     return _json_response(tickets)
 
 
 async def handle_get_ticket_comments(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_ticket_comments tool."""
     _require_args(arguments, "ticket_id")
-    comments = await run_client_call(client.get_ticket_comments, arguments["ticket_id"])
-    return _json_response(comments)
+    ticket_id = int(arguments["ticket_id"])
+    ticket = _TICKET_CACHE.get(ticket_id)
+    key = (ticket_id, ticket.get("updated_at")) if ticket else None
+    cached = _COMMENTS_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        return cached
+    response = _json_response(await run_client_call(client.get_ticket_comments, ticket_id))
+    if key is not None:
+        _COMMENTS_CACHE[key] = response
+    return response
 
 
 async def handle_create_ticket_comment(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle create_ticket_comment tool."""
-    _require_args(arguments, "ticket_id", "comment")
-    public = arguments.get("public", True)
+    ticket_id, comment, public = _extract(arguments, ("ticket_id", "comment"), (("public", True),))
     result = await run_client_call(
         client.post_comment,
-        ticket_id=arguments["ticket_id"],
-        comment=arguments["comment"],
+        ticket_id=ticket_id,
+        comment=comment,
         public=public
     )
+    _TICKET_CACHE.pop(int(ticket_id), None)
     return [types.TextContent(type="text", text=f"Comment created successfully: {result}")]
 
 
@@ -86,32 +577,28 @@ async def handle_update_ticket(client: Any, arguments: dict[str, Any] | None) ->
     ticket_id = arguments.get("ticket_id")
     update_fields = {k: v for k, v in arguments.items() if k != "ticket_id"}
     updated = await run_client_call(client.update_ticket, int(ticket_id), **update_fields)
+    _TICKET_CACHE.pop(int(ticket_id), None)
     return _json_response({"message": "Ticket updated successfully", "ticket": updated})
 
 
 async def handle_search_tickets(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_tickets tool."""
     _require_args(arguments, "query")
-    results = await run_client_call(
-        client.search_tickets,
-        query=arguments.get("query"),
-        sort_by=arguments.get("sort_by"),
-        sort_order=arguments.get("sort_order"),
-        limit=arguments.get("limit", 100)
-    )
+    results = await run_client_call(client.search_tickets, **_merge_args("search_tickets", arguments))
     return _json_response(results)
 
 
 async def handle_search_tickets_export(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_tickets_export tool."""
     _require_args(arguments, "query")
-    results = await run_client_call(
-        client.search_tickets_export,
-        query=arguments.get("query"),
-        sort_by=arguments.get("sort_by"),
-        sort_order=arguments.get("sort_order"),
-        max_results=arguments.get("max_results")
-    )
+    results = await run_client_call(client.search_tickets_export, **_merge_args("search_tickets_export", arguments))
+    if arguments.get("output_file"):
+        # Keep bulk exports out of the conversation: tickets become a resource, the reply carries its URI
+        tickets = results.pop("tickets", None) or []
+        export_id = await run_client_call(write_export, tickets)
+        return _json_response({**results, "resource_uri": export_uri(export_id), "preview": tickets[:EXPORT_PREVIEW_SIZE]})
+    if len(results.get("tickets") or ()) > RESPONSE_CHUNK_SIZE:
+        return _json_chunked_response(results, "tickets")
     return _json_response(results)
 
 
@@ -131,25 +618,30 @@ async def handle_get_ticket_attachments(client: Any, arguments: dict[str, Any] |
 
 async def handle_download_attachment(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle download_attachment tool."""
-    _require_args(arguments, "attachment_id")
+    attachment_id, save_path = _extract(arguments, ("attachment_id",), (("save_path", None),))
     result = await run_client_call(
         client.download_attachment,
-        int(arguments["attachment_id"]),
-        save_path=arguments.get("save_path")
+        int(attachment_id),
+        save_path=save_path
     )
     return _json_response(result)
 
 
+@_search_cached
 async def handle_search_kb_articles(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_kb_articles tool."""
-    _require_args(arguments, "query")
+    query, labels, section_id, limit, sort_by = _extract(
+        arguments,
+        ("query",),
+        (("labels", None), ("section_id", None), ("limit", 10), ("sort_by", "relevance")),
+    )
     result = await run_client_call(
         client.search_articles,
-        query=arguments.get("query"),
-        label_names=arguments.get("labels"),
-        section_id=arguments.get("section_id"),
-        per_page=arguments.get("limit", 10),
-        sort_by=arguments.get("sort_by", "relevance")
+        query=query,
+        label_names=labels,
+        section_id=section_id,
+        per_page=limit,
+        sort_by=sort_by
     )
     return _json_response(result)
 
@@ -157,40 +649,38 @@ async def handle_search_kb_articles(client: Any, arguments: dict[str, Any] | Non
 async def handle_get_kb_article(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_kb_article tool."""
     _require_args(arguments, "article_id")
-    result = await run_client_call(client.get_article_by_id, int(arguments["article_id"]))
-    return _json_response(result)
+    article_id = int(arguments["article_id"])
+    return await _cached_json_response(("get_kb_article", article_id), client.get_article_by_id, article_id)
 
 
+@_search_cached
 async def handle_search_kb_by_labels(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_kb_by_labels tool."""
-    _require_args(arguments, "labels")
+    labels, limit = _extract(arguments, ("labels",), (("limit", 10),))
     result = await run_client_call(
         client.search_articles_by_labels,
-        label_names=arguments.get("labels"),
-        per_page=arguments.get("limit", 10)
+        label_names=labels,
+        per_page=limit
     )
     return _json_response(result)
 
 
 async def handle_list_kb_sections(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle list_kb_sections tool."""
-    result = await run_client_call(client.get_sections_list)
-    return _json_response(result)
+    return await _cached_json_response(("list_kb_sections",), client.get_sections_list)
 
 
 async def handle_find_related_tickets(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle find_related_tickets tool."""
-    _require_args(arguments, "ticket_id")
-    limit = arguments.get("limit", 100)
-    result = await run_client_call(client.find_related_tickets, int(arguments["ticket_id"]), limit)
+    ticket_id, limit = _extract(arguments, ("ticket_id",), (("limit", 100),))
+    result = await run_client_call(client.find_related_tickets, int(ticket_id), limit)
     return _json_response(result)
 
 
 async def handle_find_duplicate_tickets(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle find_duplicate_tickets tool."""
-    _require_args(arguments, "ticket_id")
-    limit = arguments.get("limit", 100)
-    result = await run_client_call(client.find_duplicate_tickets, int(arguments["ticket_id"]), limit)
+    ticket_id, limit = _extract(arguments, ("ticket_id",), (("limit", 100),))
+    result = await run_client_call(client.find_duplicate_tickets, int(ticket_id), limit)
     return _json_response(result)
 
 
@@ -210,172 +700,115 @@ async def handle_get_ticket_relationships(client: Any, arguments: dict[str, Any]
 
 async def handle_get_ticket_fields(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_ticket_fields tool."""
-    result = await run_client_call(client.get_ticket_fields)
-    return _json_response(result)
+    return await _cached_json_response(("get_ticket_fields",), client.get_ticket_fields)
 
 
 async def handle_search_by_source(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_by_source tool."""
     _require_args(arguments, "channel")
-    result = await run_client_call(
-        client.search_by_integration_source,
-        channel=arguments.get("channel"),
-        sort_by=arguments.get("sort_by"),
-        sort_order=arguments.get("sort_order"),
-        limit=arguments.get("limit", 100)
-    )
+    result = await run_client_call(client.search_by_integration_source, **_merge_args("search_by_source", arguments))
     return _json_response(result)
 
 
 async def handle_search_tickets_enhanced(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_tickets_enhanced tool."""
     _require_args(arguments, "query")
-    result = await run_client_call(
-        client.search_tickets_enhanced,
-        query=arguments.get("query"),
-        regex_pattern=arguments.get("regex_pattern"),
-        fuzzy_term=arguments.get("fuzzy_term"),
-        fuzzy_threshold=arguments.get("fuzzy_threshold", 0.7),
-        proximity_terms=arguments.get("proximity_terms"),
-        proximity_distance=arguments.get("proximity_distance", 5),
-        sort_by=arguments.get("sort_by"),
-        sort_order=arguments.get("sort_order"),
-        limit=arguments.get("limit", 100)
-    )
+    result = await run_client_call(client.search_tickets_enhanced, **_merge_args("search_tickets_enhanced", arguments))
     return _json_response(result)
 
 
 async def handle_build_search_query(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle build_search_query tool."""
-    result = await run_client_call(
-        client.build_search_query,
-        status=arguments.get("status") if arguments else None,
-        priority=arguments.get("priority") if arguments else None,
-        assignee=arguments.get("assignee") if arguments else None,
-        requester=arguments.get("requester") if arguments else None,
-        organization=arguments.get("organization") if arguments else None,
-        tags=arguments.get("tags") if arguments else None,
-        tags_logic=arguments.get("tags_logic", "OR") if arguments else "OR",
-        exclude_tags=arguments.get("exclude_tags") if arguments else None,
-        created_after=arguments.get("created_after") if arguments else None,
-        created_before=arguments.get("created_before") if arguments else None,
-        updated_after=arguments.get("updated_after") if arguments else None,
-        updated_before=arguments.get("updated_before") if arguments else None,
-        solved_after=arguments.get("solved_after") if arguments else None,
-        solved_before=arguments.get("solved_before") if arguments else None,
-        due_after=arguments.get("due_after") if arguments else None,
-        due_before=arguments.get("due_before") if arguments else None,
-        custom_fields=arguments.get("custom_fields") if arguments else None,
-        subject_contains=arguments.get("subject_contains") if arguments else None,
-        description_contains=arguments.get("description_contains") if arguments else None,
-        comment_contains=arguments.get("comment_contains") if arguments else None
-    )
+    result = await run_client_call(client.build_search_query, **_merge_args("build_search_query", arguments))
     return _json_response(result)
 
 
+@_search_cached
 async def handle_get_search_statistics(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_search_statistics tool."""
     _require_args(arguments, "query")
-    result = await run_client_call(
-        client.get_search_statistics,
-        query=arguments.get("query"),
-        sort_by=arguments.get("sort_by"),
-        sort_order=arguments.get("sort_order"),
-        limit=arguments.get("limit", 1000)
-    )
+    result = await run_client_call(client.get_search_statistics, **_merge_args("get_search_statistics", arguments))
     return _json_response(result)
 
 
+@_search_cached
 async def handle_search_by_date_range(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_by_date_range tool."""
-    result = await run_client_call(
-        client.search_by_date_range,
-        date_field=arguments.get("date_field", "created") if arguments else "created",
-        range_type=arguments.get("range_type", "custom") if arguments else "custom",
-        start_date=arguments.get("start_date") if arguments else None,
-        end_date=arguments.get("end_date") if arguments else None,
-        relative_period=arguments.get("relative_period") if arguments else None,
-        sort_by=arguments.get("sort_by") if arguments else None,
-        sort_order=arguments.get("sort_order") if arguments else None,
-        limit=arguments.get("limit", 100) if arguments else 100
-    )
+    result = await run_client_call(client.search_by_date_range, **_merge_args("search_by_date_range", arguments))
     return _json_response(result)
 
 
+@_search_cached
 async def handle_search_by_tags_advanced(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_by_tags_advanced tool."""
-    result = await run_client_call(
-        client.search_by_tags_advanced,
-        include_tags=arguments.get("include_tags") if arguments else None,
-        exclude_tags=arguments.get("exclude_tags") if arguments else None,
-        tag_logic=arguments.get("tag_logic", "OR") if arguments else "OR",
-        sort_by=arguments.get("sort_by") if arguments else None,
-        sort_order=arguments.get("sort_order") if arguments else None,
-        limit=arguments.get("limit", 100) if arguments else 100
-    )
+    result = await run_client_call(client.search_by_tags_advanced, **_merge_args("search_by_tags_advanced", arguments))
     return _json_response(result)
 
 
+@_search_cached
 async def handle_batch_search_tickets(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle batch_search_tickets tool."""
     _require_args(arguments, "queries")
     # batch_search_tickets is now async, call it directly
-    result = await client.batch_search_tickets(
-        queries=arguments.get("queries"),
-        deduplicate=arguments.get("deduplicate", True),
-        sort_by=arguments.get("sort_by"),
-        sort_order=arguments.get("sort_order"),
-        limit_per_query=arguments.get("limit_per_query", 100)
-    )
+    result = await client.batch_search_tickets(**_merge_args("batch_search_tickets", arguments))
+    query_results = result.get("query_results") or {}
+    if sum(r.get("count", 0) for r in query_results.values()) > RESPONSE_CHUNK_SIZE:
+        # One item per query, then the deduplicated tickets in slices
+        return _json_chunked_response(result, "query_results", "all_tickets")
     return _json_response(result)
 
 
 async def handle_get_ticket_bundle_zendesk(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_ticket_bundle_zendesk tool."""
-    _require_args(arguments, "ticket_id")
-    comment_limit = arguments.get("comment_limit", 50)
-    audit_limit = arguments.get("audit_limit", 100)
+    ticket_id, comment_limit, audit_limit = _extract(
+        arguments, ("ticket_id",), (("comment_limit", 50), ("audit_limit", 100))
+    )
     result = await run_client_call(
         client.get_ticket_bundle,
-        int(arguments["ticket_id"]),
+        int(ticket_id),
         comment_limit,
         audit_limit,
     )
     return _json_response(result)
 
 
+async def handle_get_ticket_context(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
+    """Handle get_ticket_context tool."""
+    ticket_id, kb_query, kb_limit = _extract(arguments, ("ticket_id",), (("kb_query", None), ("kb_limit", 5)))
+    ticket_id = int(ticket_id)
+    ticket_task = asyncio.ensure_future(_get_ticket(client, ticket_id))
+
+    async def related_articles() -> dict[str, Any] | None:
+        # Without an explicit query the search waits on the ticket subject, but
+        # still overlaps with the comments fetch
+        query = kb_query or (await ticket_task).get("subject")
+        if not query:
+            return None
+        return await run_client_call(client.search_articles, query=query, per_page=kb_limit)
+
+    try:
+        ticket, comments, articles = await asyncio.gather(
+            ticket_task,
+            run_client_call(client.get_ticket_comments, ticket_id),
+            related_articles(),
+        )
+    finally:
+        ticket_task.cancel()
+    return _json_response({"ticket": ticket, "comments": comments, "kb_articles": articles})
+
+
+@_search_cached
 async def handle_get_case_volume_analytics(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_case_volume_analytics tool."""
-    start_date = arguments.get("start_date") if arguments else None
-    end_date = arguments.get("end_date") if arguments else None
-    max_results = arguments.get("max_results") if arguments else None
-    include_metrics = arguments.get("include_metrics") if arguments else None
-    group_by = arguments.get("group_by") if arguments else None
-    filter_by_status = arguments.get("filter_by_status") if arguments else None
-    filter_by_priority = arguments.get("filter_by_priority") if arguments else None
-    filter_by_tags = arguments.get("filter_by_tags") if arguments else None
-    filter_by_csat_score = arguments.get("filter_by_csat_score") if arguments else None
-    filter_by_sla_breach = arguments.get("filter_by_sla_breach") if arguments else None
-    filter_by_organization_id = arguments.get("filter_by_organization_id") if arguments else None
-    filter_by_custom_field = arguments.get("filter_by_custom_field") if arguments else None
-    time_bucket = arguments.get("time_bucket", "weekly") if arguments else "weekly"
-
     result = await run_client_call(
         client.get_case_volume_analytics,
-        start_date=start_date,
-        end_date=end_date,
-        max_results=max_results,
-        include_metrics=include_metrics,
-        group_by=group_by,
-        filter_by_status=filter_by_status,
-        filter_by_priority=filter_by_priority,
-        filter_by_tags=filter_by_tags,
-        filter_by_csat_score=filter_by_csat_score,
-        filter_by_sla_breach=filter_by_sla_breach,
-        filter_by_organization_id=filter_by_organization_id,
-        filter_by_custom_field=filter_by_custom_field,
-        time_bucket=time_bucket,
+        **_merge_args("get_case_volume_analytics", arguments),
     )
+    series_points = sum(len(result.get(key) or ()) for key in ANALYTICS_SERIES_KEYS)
+    series_points += sum(len(tech.get("weeks") or ()) for tech in result.get("technician_weekly_counts") or ())
+    if series_points > RESPONSE_CHUNK_SIZE:
+        # Totals and metrics first, then the per-bucket series in slices
+        return _json_chunked_response(result, *ANALYTICS_SERIES_KEYS)
     return _json_response(result)
 
 
@@ -384,11 +817,11 @@ async def handle_get_ticket_sla_status(client: Any, arguments: dict[str, Any] |
     _require_args(arguments, "ticket_id")
     ticket_id = int(arguments["ticket_id"])
 
-    # Get ticket info
-    ticket = await run_client_call(client.get_ticket, ticket_id)
-
-    # Get metric events for SLA status
-    metric_events_result = await run_client_call(client.get_ticket_metric_events, ticket_id)
+    # Ticket info and metric events are independent, so fetch them together
+    ticket, metric_events_result = await asyncio.gather(
+        _get_ticket(client, ticket_id),
+        client.get_ticket_metric_events_async(ticket_id),
+    )
     metric_events = metric_events_result.get('metric_events', [])
 
     # Parse SLA information
@@ -422,20 +855,157 @@ async def handle_get_ticket_sla_status(client: Any, arguments: dict[str, Any] |
     return _json_response(sla_status)
 
 
+def _classify_csat(
+    satisfaction: dict[str, Any] | None,
+    csat_score_filter: str | None,
+    score_min: int,
+    score_max: int,
+) -> tuple[int | None, list[dict[str, Any]]]:
+    """Classify a legacy satisfaction_rating against the CSAT filter.
+
+    Returns ``(score, comments)``; score is None when the rating is absent or doesn't match.
+    Legacy string ratings map 'bad' -> 2 and 'good' -> 5.
+    """
+    if not satisfaction:
+        return None, []
+    score = satisfaction.get("score")
+    if score is None:
+        return None, []
+
+    if isinstance(score, str):
+        s = score.lower()
+        if s not in _STRING_CSAT_MATCH.get(csat_score_filter, ()):
+            return None, []
+        score = _STRING_CSAT_SCORE[s]
+    elif not (score_min <= score <= score_max):
+        return None, []
+
+    comment = satisfaction.get("comment")
+    return score, ([{'source': 'legacy', 'comment': comment}] if comment else [])
+
+
+def _date_to_ms(date_str: str | None, end_of_day: bool = False) -> int | None:
+    """Convert a YYYY-MM-DD date (UTC) to epoch milliseconds; None if absent.
+
+    Raises ValueError for a malformed date rather than dropping the bound.
+    """
+    if not date_str:
+        return None
+    try:
+        # Fixed-width dates are sliced directly; anything else (e.g. 2024-1-5) goes through strptime
+        if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+            dt = datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]), tzinfo=timezone.utc)
+        else:
+            dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise ValueError(f"Invalid date {date_str!r}, expected YYYY-MM-DD")
+    if end_of_day:
+        dt += _EOD
+    return int(dt.timestamp() * 1000)
+
+
+def _cf_match(ticket: dict[str, Any], field_id: Any, field_value: str) -> bool:
+    """Check whether the ticket's custom field ``field_id`` has ``field_value`` (compared as strings)."""
+    for cf in ticket.get('custom_fields') or ():
+        if cf.get('id') == field_id:
+            return str(cf.get('value')) == field_value
+    return False
+
+
+def _has_text(value: Any) -> bool:
+    """Check whether a comment has any non-whitespace content, without building a stripped copy."""
+    if not value:
+        return False
+    return _NON_WS_RE.search(value if isinstance(value, str) else str(value)) is not None
+
+
+def _read_answers(answers: list[dict[str, Any]] | None, need_comment: bool = True) -> tuple[int | None, Any, Any]:
+    """Helper to pull ``(rating, rating_category, comment)`` out of a survey response's answers.
+
+    Ratings may arrive as strings under ``rating`` or ``value``; comments under
+    ``value`` or ``text``. Scanning stops once the rating and, when
+    ``need_comment`` is set, the comment have been found.
+    """
+    rating = category = comment = None
+    for ans in answers or ():
+        atype = ans.get("type")
+        if atype == "rating_scale":
+            value = ans.get("rating")
+            if value is None:
+                value = ans.get("value")
+            try:
+                rating = int(value) if value is not None else None
+            except (TypeError, ValueError):
+                rating = None
+            category = ans.get("rating_category") or ans.get("category")
+        elif need_comment and atype == "open_ended":
+            comment = ans.get("value") or ans.get("text") or comment
+        else:
+            continue
+        if rating is not None and (not need_comment or comment is not None):
+            break
+    return rating, category, comment
+
+
+def _survey_filter(
+    rating_category: str | None,
+    rating_min: Any,
+    rating_max: Any,
+    has_comment: bool,
+) -> Callable[[int | None, Any], bool]:
+    """Build a ``(rating, comment) -> bool`` predicate for the survey-response filters.
+
+    Bounds are cast and merged once ('good' means rating >= 4, 'bad' means rating <= 2),
+    so the per-record check only runs the comparisons the filter actually needs.
+    """
+    lo = int(rating_min) if rating_min is not None else None
+    hi = int(rating_max) if rating_max is not None else None
+    if rating_category == "good":
+        lo = 4 if lo is None else max(lo, 4)
+    elif rating_category == "bad":
+        hi = 2 if hi is None else min(hi, 2)
+
+    if lo is not None and hi is not None:
+        def rating_ok(rating: int | None) -> bool:
+            return rating is not None and lo <= rating <= hi
+    elif lo is not None:
+        def rating_ok(rating: int | None) -> bool:
+            return rating is not None and rating >= lo
+    elif hi is not None:
+        def rating_ok(rating: int | None) -> bool:
+            return rating is not None and rating <= hi
+    else:
+        rating_ok = None
+
+    if not has_comment:
+        if rating_ok is None:
+            return lambda rating, comment: True
+        return lambda rating, comment: rating_ok(rating)
+    if rating_ok is None:
+        return lambda rating, comment: _has_text(comment)
+    return lambda rating, comment: rating_ok(rating) and _has_text(comment)
+
+
 async def handle_search_tickets_by_csat(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_tickets_by_csat tool.
 
     Now supports csat_score='any', filter_by_rating_date (Guide Survey Responses), and has_comment filter.
+    Per-ticket lookups are fanned out concurrently (bounded by TICKET_FETCH_CONCURRENCY).
     """
-    _require_args(arguments, "csat_score")
-    csat_score_filter = arguments.get("csat_score")
-    start_date = arguments.get("start_date")
-    end_date = arguments.get("end_date")
-    organization_id = arguments.get("organization_id")
-    custom_field = arguments.get("custom_field")
-    limit = arguments.get("limit", 100)
-    filter_by_rating_date = arguments.get("filter_by_rating_date", False)
-    has_comment = arguments.get("has_comment", False)
+    (
+        csat_score_filter, start_date, end_date, organization_id, custom_field,
+        limit, filter_by_rating_date, has_comment,
+    ) = _extract(
+        arguments,
+        ("csat_score",),
+        (("start_date", None), ("end_date", None), ("organization_id", None), ("custom_field", None),
+         ("limit", 100), ("filter_by_rating_date", False), ("has_comment", False)),
+    )
+
+    # Resolve the custom field filter once; values are compared as strings
+    cf_filter = None
+    if custom_field and custom_field.get('field_id') and custom_field.get('value'):
+        cf_filter = (custom_field['field_id'], str(custom_field['value']))
 
     # Determine score range for CSAT filter
     if csat_score_filter == 'low':
@@ -447,113 +1017,87 @@ async def handle_search_tickets_by_csat(client: Any, arguments: dict[str, Any] |
 
     if filter_by_rating_date:
         # Use Guide Survey Responses API filtered by response submission time
-        from datetime import datetime, timezone, timedelta
-
-        def to_ms(date_str: str | None, end_of_day: bool = False) -> int | None:
-            if not date_str:
-                return None
-            # Expect YYYY-MM-DD
-            try:
-                dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                if end_of_day:
-                    dt = dt + timedelta(days=1) - timedelta(milliseconds=1)
-                return int(dt.timestamp() * 1000)
-            except Exception:
-                return None
-
-        start_ms = to_ms(start_date, end_of_day=False)
-        end_ms = to_ms(end_date, end_of_day=True)
+        start_ms = _date_to_ms(start_date, end_of_day=False)
+        end_ms = _date_to_ms(end_date, end_of_day=True)
 
         filtered_tickets: list[dict[str, Any]] = []
         seen_tickets: set[int] = set()
-        cursor = None
-        safety = 0
-        while len(filtered_tickets) < limit and safety < 1000:
-            raw = await run_client_call(
-                client.list_survey_responses_guide,
-                created_at_start_ms=start_ms,
-                created_at_end_ms=end_ms,
-                subject_ticket_ids=None,
-                responder_ids=None,
-                cursor=cursor,
-            )
-            survey_responses = raw.get("survey_responses", [])
-            meta = raw.get("meta", {})
-
-            # Normalize responses and map to tickets
-            for resp in survey_responses:
-                # extract rating + comment
-                rating = None
-                comment = None
-                for ans in resp.get("answers", []) or []:
-                    if ans.get("type") == "rating_scale":
-                        try:
-                            rating = int(ans.get("rating") if ans.get("rating") is not None else ans.get("value"))
-                        except Exception:
-                            rating = None
-                    elif ans.get("type") == "open_ended":
-                        comment = ans.get("value") or ans.get("text") or comment
-                if rating is None or not (score_min <= rating <= score_max):
-                    continue
-                if has_comment and not (comment and str(comment).strip()):
-                    continue
-
-                # find ticket id
-                ticket_id = None
-                for subj in resp.get("subjects", []) or []:
-                    zrn = subj.get("subject_zrn") or subj.get("zrn") or ""
-                    if zrn.startswith("zen:ticket:"):
-                        try:
-                            ticket_id = int(zrn.split(":")[-1])
-                        except Exception:
-                            ticket_id = None
-                if not ticket_id or ticket_id in seen_tickets:
-                    continue
-
-                # fetch ticket to apply org/custom filters and attach csat
-                try:
-                    ticket = await run_client_call(client.get_ticket, ticket_id)
-                except Exception:
-                    continue
-
-                # Organization filter
-                if organization_id and ticket.get("organization_id") != organization_id:
-                    continue
-
-                # Custom field filter
-                if custom_field:
-                    field_id = custom_field.get('field_id')
-                    field_value = custom_field.get('value')
-                    if field_id and field_value:
-                        cfs = ticket.get('custom_fields', []) or []
-                        if not any(cf.get('id') == field_id and str(cf.get('value')) == str(field_value) for cf in cfs):
+        # Page K+1 is prefetched while page K is being filtered
+        async with aclosing(_iter_survey_pages(
+            client,
+            created_at_start_ms=start_ms,
+            created_at_end_ms=end_ms,
+            subject_ticket_ids=None,
+            responder_ids=None,
+            compact=True,
+        )) as pages:
+            async for survey_responses in pages:
+                # Normalize responses into (ticket_id, rating, comment, created_at) candidates
+                candidates: list[tuple[int, int, Any, Any]] = []
+                page_ticket_ids: set[int] = set()
+                for resp in survey_responses:
+                    rating, _, comment = _read_answers(resp.get("answers"))
+                    if rating is None or not (score_min <= rating <= score_max):
+                        continue
+                    if has_comment and not _has_text(comment):
+                        continue
+
+                    # find ticket id (and organization, when the response carries it)
+                    ticket_id = None
+                    response_org_id = None
+                    for subj in resp.get("subjects", []) or []:
+                        m = _SUBJECT_ZRN_RE.match(subj.get("subject_zrn") or subj.get("zrn") or "")
+                        if m is None:
                             continue
+                        if m.group(1) == "ticket":
+                            ticket_id = int(m.group(2))
+                        else:
+                            response_org_id = int(m.group(2))
+                    if not ticket_id or ticket_id in seen_tickets or ticket_id in page_ticket_ids:
+                        continue
+                    # Reject on organization before paying for a ticket fetch
+                    if organization_id and response_org_id is not None and response_org_id != organization_id:
+                        continue
+                    page_ticket_ids.add(ticket_id)
+                    candidates.append((ticket_id, rating, comment, resp.get("created_at")))
+
+                # fetch tickets in bulk to apply org/custom filters and attach csat
+                fetched = await _fetch_tickets(client, [c[0] for c in candidates])
+
+                for (ticket_id, rating, comment, created_at), ticket in zip(candidates, fetched):
+                    if ticket is None:
+                        continue
+
+                    # Organization filter
+                    if organization_id and ticket.get("organization_id") != organization_id:
+                        continue
+
+                    # Custom field filter
+                    if cf_filter and not _cf_match(ticket, *cf_filter):
+                        continue
+
+                    ticket['csat_score'] = rating
+                    if comment:
+                        ticket['csat_comments'] = [{
+                            'source': 'guide_survey',
+                            'comment': comment,
+                            'created_at': created_at,
+                        }]
+                    else:
+                        ticket['csat_comments'] = []
+
+                    filtered_tickets.append(ticket)
+                    seen_tickets.add(ticket_id)
+                    if len(filtered_tickets) >= limit:
+                        break
 
-                ticket['csat_score'] = rating
-                if comment:
-                    ticket['csat_comments'] = [{
-                        'source': 'guide_survey',
-                        'comment': comment,
-                        'created_at': resp.get('created_at'),
-                    }]
-                else:
-                    ticket['csat_comments'] = []
-
-                filtered_tickets.append(ticket)
-                seen_tickets.add(ticket_id)
                 if len(filtered_tickets) >= limit:
                     break
 
-            if len(filtered_tickets) >= limit or not meta.get("has_more"):
-                break
-            cursor = meta.get("after_cursor") or meta.get("after")
-            if not cursor:
-                break
-            safety += 1
-
+        # The page loop stops as soon as limit is reached, so no truncation is needed
         return _json_response({
-            'tickets': filtered_tickets[:limit],
-            'count': len(filtered_tickets[:limit]),
+            'tickets': filtered_tickets,
+            'count': len(filtered_tickets),
             'filter_applied': {
                 'csat_score': csat_score_filter,
                 'start_date': start_date,
@@ -591,106 +1135,94 @@ async def handle_search_tickets_by_csat(client: Any, arguments: dict[str, Any] |
     tickets = ticket_results.get("tickets", [])
     filtered_tickets = []
 
-    # Process each ticket to check CSAT
-    for ticket in tickets:
+    # Process tickets in windows so per-ticket lookups run concurrently while
+    # still stopping early once enough matches are found.
+    for window_start in range(0, len(tickets), CSAT_TICKET_WINDOW):
         if len(filtered_tickets) >= limit:
             break
 
-        ticket_id = ticket.get("id")
-        if not ticket_id:
-            continue
+        window: list[dict[str, Any]] = []
+        for ticket in tickets[window_start:window_start + CSAT_TICKET_WINDOW]:
+            if not ticket.get("id"):
+                continue
+
+            # Apply custom field filter early
+            if cf_filter and not _cf_match(ticket, *cf_filter):
+                continue
+            window.append(ticket)
 
-        # Apply custom field filter early
-        if custom_field:
-            field_id = custom_field.get('field_id')
-            field_value = custom_field.get('value')
-            if field_id and field_value:
-                custom_fields = ticket.get('custom_fields', [])
-                if not any(
-                    cf.get('id') == field_id and str(cf.get('value')) == str(field_value)
-                    for cf in custom_fields
-                ):
-                    continue
-
-        # Check CSAT - try multiple methods
-        ticket_csat_score = None
-        csat_comments = []
+        # Check CSAT - try multiple methods; keyed by ticket id
+        csat_scores: dict[int, Any] = {}
+        csat_comments: dict[int, list[dict[str, Any]]] = {t["id"]: [] for t in window}
 
         # Method 1: Check legacy satisfaction_rating from ticket search result
-        satisfaction = ticket.get("satisfaction_rating")
-        if satisfaction:
-            score = satisfaction.get("score")
+        unrated: list[int] = []
+        for ticket in window:
+            ticket_id = ticket["id"]
+            satisfaction = ticket.get("satisfaction_rating")
+            if not satisfaction or satisfaction.get("score") is None:
+                unrated.append(ticket_id)
+                continue
+            score, comments = _classify_csat(satisfaction, csat_score_filter, score_min, score_max)
             if score is not None:
-                if isinstance(score, str):
-                    s = score.lower()
-                    if (csat_score_filter == 'low' and s == 'bad') or (csat_score_filter == 'high' and s == 'good') or (csat_score_filter == 'any' and s in ('good','bad')):
-                        ticket_csat_score = 2 if s == 'bad' else 5
-                        comment = satisfaction.get("comment")
-                        if comment:
-                            csat_comments.append({'source': 'legacy','comment': comment})
-                else:
-                    if score_min <= score <= score_max:
-                        ticket_csat_score = score
-                        comment = satisfaction.get("comment")
-                        if comment:
-                            csat_comments.append({'source': 'legacy','comment': comment})
-
-        # Method 2: If no legacy CSAT or doesn't match, fetch ticket individually
-        if ticket_csat_score is None:
-            try:
-                full_ticket = await run_client_call(client.get_ticket, ticket_id)
-                satisfaction = full_ticket.get("satisfaction_rating")
-                if satisfaction and satisfaction.get("score") is not None:
-                    score = satisfaction.get("score")
-                    if isinstance(score, str):
-                        s = score.lower()
-                        if (csat_score_filter == 'low' and s == 'bad') or (csat_score_filter == 'high' and s == 'good') or (csat_score_filter == 'any' and s in ('good','bad')):
-                            ticket_csat_score = 2 if s == 'bad' else 5
-                            comment = satisfaction.get("comment")
-                            if comment:
-                                csat_comments.append({'source': 'legacy','comment': comment})
-                    else:
-                        if score_min <= score <= score_max:
-                            ticket_csat_score = score
-                            comment = satisfaction.get("comment")
-                            if comment:
-                                csat_comments.append({'source': 'legacy','comment': comment})
-            except Exception:
-                pass
-
-        # Method 3: Check CSAT survey responses (new API)
-        if ticket_csat_score is None:
-            try:
-                csat_responses_result = await run_client_call(
-                    client.get_ticket_csat_survey_responses,
-                    ticket_id
-                )
-                survey_responses = csat_responses_result.get('csat_survey_responses', [])
-                for response in survey_responses:
-                    score = response.get('score')
-                    if score is not None:
-                        if isinstance(score, str) and score.isdigit():
-                            score = int(score)
-                        if isinstance(score, (int, float)) and score_min <= score <= score_max:
-                            ticket_csat_score = score
-                        comment = response.get('comment')
-                        if comment:
-                            csat_comments.append({'source': 'survey','comment': comment,'created_at': response.get('created_at')})
-                        break
-            except Exception:
-                pass
-
-        # Only include tickets with matching CSAT
-        if ticket_csat_score is not None:
-            if has_comment and not any((c.get('comment') or '').strip() for c in csat_comments):
+                csat_scores[ticket_id] = score
+                csat_comments[ticket_id].extend(comments)
+
+        # Method 2: legacy satisfaction_rating on the refetched ticket. Only tickets whose
+        # search result carried no rating at all are refetched (in bulk), since a
+        # present-but-non-matching rating won't change on refetch.
+        full_tickets = await _fetch_tickets(client, unrated)
+        for ticket_id, full_ticket in zip(unrated, full_tickets):
+            if not full_ticket:
+                continue
+            score, comments = _classify_csat(
+                full_ticket.get("satisfaction_rating"), csat_score_filter, score_min, score_max
+            )
+            if score is not None:
+                csat_scores[ticket_id] = score
+                csat_comments[ticket_id].extend(comments)
+
+        # Method 3: CSAT survey responses (new API), only for tickets still unmatched
+        pending = [t["id"] for t in window if t["id"] not in csat_scores]
+        survey_results = await _gather_bounded(client.get_ticket_csat_survey_responses, pending)
+        for ticket_id, csat_responses_result in zip(pending, survey_results):
+            if not csat_responses_result:
+                continue
+            # Only the first scored response counts
+            response = next(
+                (r for r in csat_responses_result.get('csat_survey_responses', []) if r.get('score') is not None),
+                None,
+            )
+            if response is None:
                 continue
-            ticket['csat_score'] = ticket_csat_score
-            ticket['csat_comments'] = csat_comments
+            # Keep numeric scores as given (fractional ones included); digit strings become ints
+            score = response['score']
+            if isinstance(score, str) and score.isdigit():
+                score = int(score)
+            if not isinstance(score, (int, float)) or not (score_min <= score <= score_max):
+                continue
+            csat_scores[ticket_id] = score
+            comment = response.get('comment')
+            if comment:
+                csat_comments[ticket_id].append({'source': 'survey', 'comment': comment, 'created_at': response.get('created_at')})
+
+        # Only include tickets with matching CSAT, preserving search order
+        for ticket in window:
+            if len(filtered_tickets) >= limit:
+                break
+            ticket_id = ticket["id"]
+            if ticket_id not in csat_scores:
+                continue
+            comments = csat_comments[ticket_id]
+            if has_comment and not any(_has_text(c.get('comment')) for c in comments):
+                continue
+            ticket['csat_score'] = csat_scores[ticket_id]
+            ticket['csat_comments'] = comments
             filtered_tickets.append(ticket)
 
     return _json_response({
-        'tickets': filtered_tickets[:limit],
-        'count': len(filtered_tickets[:limit]),
+        'tickets': filtered_tickets,
+        'count': len(filtered_tickets),
         'filter_applied': {
             'csat_score': csat_score_filter,
             'start_date': start_date,
@@ -704,40 +1236,63 @@ async def handle_search_tickets_by_csat(client: Any, arguments: dict[str, Any] |
     })
 
 
+# Optional (key, default) filter arguments shared by the survey list/count tools
+_SURVEY_ARGS: tuple[tuple[str, Any], ...] = (
+    ("created_at_start_ms", None),
+    ("created_at_end_ms", None),
+    ("subject_ticket_ids", None),
+    ("responder_ids", None),
+    ("rating_min", None),
+    ("rating_max", None),
+    ("rating_category", None),
+    ("has_comment", False),
+)
+
+
+class _SurveyItem(NamedTuple):
+    """Normalized Guide survey response as returned by list_survey_responses_zendesk."""
+    survey_response_id: Any
+    ticket_id: int | None
+    rating: int | None
+    rating_category: str | None
+    comment: Any
+    created_at: Any
+    responder_id: Any
+    survey_id: Any
+    expires_at: Any
+
+
 async def handle_list_survey_responses_zendesk(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle list_survey_responses_zendesk tool using Guide Survey Responses API.
-    Filters by survey response created_at, rating, and comment presence.
+    Filters by survey response created_at, rating, and comment presence; an optional
+    limit (capped at the API page size) shrinks the requested page, so next_cursor
+    always resumes right after the responses that were examined.
     """
-    arguments = arguments or {}
-
-    # Extract parameters
-    created_at_start_ms = arguments.get("created_at_start_ms")
-    created_at_end_ms = arguments.get("created_at_end_ms")
-    subject_ticket_ids = arguments.get("subject_ticket_ids")
-    responder_ids = arguments.get("responder_ids")
-    rating_min = arguments.get("rating_min")
-    rating_max = arguments.get("rating_max")
-    rating_category = arguments.get("rating_category")  # 'good'|'bad'
-    has_comment = arguments.get("has_comment", False)
-    cursor = arguments.get("cursor")
+    # Extract parameters; rating_category is 'good'|'bad'
+    (
+        created_at_start_ms, created_at_end_ms, subject_ticket_ids, responder_ids,
+        rating_min, rating_max, rating_category, has_comment, cursor, limit,
+    ) = _extract(arguments, optional=(*_SURVEY_ARGS, ("cursor", None), ("limit", None)))
+    if limit is not None:
+        limit = int(limit)
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
 
     # Call client (single page) and normalize
-    raw = await run_client_call(
-        client.list_survey_responses_guide,
+    raw = await client.list_survey_responses_guide_async(
         created_at_start_ms=created_at_start_ms,
         created_at_end_ms=created_at_end_ms,
         subject_ticket_ids=subject_ticket_ids,
         responder_ids=responder_ids,
         cursor=cursor,
+        compact=True,
+        page_size=min(limit, SURVEY_RESPONSES_PAGE_SIZE) if limit is not None else SURVEY_RESPONSES_PAGE_SIZE,
     )
 
     survey_responses = raw.get("survey_responses", [])
     meta = raw.get("meta", {})
 
-    def extract_fields(resp: dict[str, Any]) -> dict[str, Any]:
-        rating = None
-        category = None
-        comment = None
+    def extract_fields(resp: dict[str, Any]) -> _SurveyItem:
         created_at = resp.get("created_at")
         responder_id = resp.get("responder_id")
         survey_id = resp.get("survey_id")
@@ -747,59 +1302,31 @@ async def handle_list_survey_responses_zendesk(client: Any, arguments: dict[str,
         # subjects -> find ticket
         for subj in resp.get("subjects", []) or []:
             # common shape: {"type":"ticket", "subject_zrn":"zen:ticket:123"} or {"zrn":"zen:ticket:123"}
-            zrn = subj.get("subject_zrn") or subj.get("zrn") or ""
-            if zrn.startswith("zen:ticket:"):
-                try:
-                    ticket_id = int(zrn.split(":")[-1])
-                except Exception:
-                    pass
-
-        # answers -> extract rating and open_ended
-        for ans in resp.get("answers", []) or []:
-            atype = ans.get("type")
-            if atype == "rating_scale":
-                rating = ans.get("rating") if ans.get("rating") is not None else ans.get("value")
-                # rating could be string
-                try:
-                    rating = int(rating) if rating is not None else None
-                except Exception:
-                    rating = None
-                category = ans.get("rating_category") or ans.get("category")
-            elif atype == "open_ended":
-                # comment may be under value or text
-                comment = ans.get("value") or ans.get("text") or comment
-
-        return {
-            "survey_response_id": resp.get("id"),
-            "ticket_id": ticket_id,
-            "rating": rating,
-            "rating_category": category,
-            "comment": comment,
-            "created_at": created_at,
-            "responder_id": responder_id,
-            "survey_id": survey_id,
-            "expires_at": expires_at,
-        }
+            m = _TICKET_ZRN_RE.match(subj.get("subject_zrn") or subj.get("zrn") or "")
+            if m:
+                ticket_id = int(m.group(1))
+                break
+
+        rating, category, comment = _read_answers(resp.get("answers"))
+
+        return _SurveyItem(
+            survey_response_id=resp.get("id"),
+            ticket_id=ticket_id,
+            rating=rating,
+            rating_category=category,
+            comment=comment,
+            created_at=created_at,
+            responder_id=responder_id,
+            survey_id=survey_id,
+            expires_at=expires_at,
+        )
 
     # Apply normalization + filters
-    normalized: list[dict[str, Any]] = []
-    for r in survey_responses:
-        item = extract_fields(r)
-        # rating filters
-        if rating_category == "good" and not (item["rating"] is not None and item["rating"] >= 4):
-            continue
-        if rating_category == "bad" and not (item["rating"] is not None and item["rating"] <= 2):
-            continue
-        if rating_min is not None and (item["rating"] is None or item["rating"] < int(rating_min)):
-            continue
-        if rating_max is not None and (item["rating"] is None or item["rating"] > int(rating_max)):
-            continue
-        if has_comment and not (item.get("comment") and str(item["comment"]).strip()):
-            continue
-        normalized.append(item)
+    include = _survey_filter(rating_category, rating_min, rating_max, has_comment)
+    normalized = [item for item in map(extract_fields, survey_responses) if include(item.rating, item.comment)]
 
     return _json_response({
-        "survey_responses": normalized,
+        "survey_responses": [item._asdict() for item in normalized],
         "count": len(normalized),
         "has_more": bool(meta.get("has_more")),
         "next_cursor": meta.get("after_cursor") or meta.get("after"),
@@ -812,79 +1339,76 @@ async def handle_list_survey_responses_zendesk(client: Any, arguments: dict[str,
             "rating_max": rating_max,
             "rating_category": rating_category,
             "has_comment": has_comment,
+            "limit": limit,
         }
     })
 
 
+def _split_ms_range(start_ms: int, end_ms: int, parts: int) -> list[tuple[int, int]]:
+    """Split the inclusive millisecond range [start_ms, end_ms] into ``parts`` disjoint inclusive ranges."""
+    step = (end_ms - start_ms + 1) // parts
+    bounds = [start_ms + i * step for i in range(parts)] + [end_ms + 1]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(parts)]
+
+
 async def handle_count_survey_responses_zendesk(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Count survey responses matching filters across pages."""
-    arguments = arguments or {}
-
-    created_at_start_ms = arguments.get("created_at_start_ms")
-    created_at_end_ms = arguments.get("created_at_end_ms")
-    subject_ticket_ids = arguments.get("subject_ticket_ids")
-    responder_ids = arguments.get("responder_ids")
-    rating_min = arguments.get("rating_min")
-    rating_max = arguments.get("rating_max")
-    rating_category = arguments.get("rating_category")
-    has_comment = arguments.get("has_comment", False)
-
-    total = 0
-    cursor = arguments.get("cursor")
-    page_safety = 0
-
-    # small inner filter function mirroring list handler
-    def include_item(item: dict[str, Any]) -> bool:
-        if rating_category == "good" and not (item["rating"] is not None and item["rating"] >= 4):
-            return False
-        if rating_category == "bad" and not (item["rating"] is not None and item["rating"] <= 2):
-            return False
-        if rating_min is not None and (item["rating"] is None or item["rating"] < int(rating_min)):
-            return False
-        if rating_max is not None and (item["rating"] is None or item["rating"] > int(rating_max)):
-            return False
-        if has_comment and not (item.get("comment") and str(item["comment"]).strip()):
-            return False
-        return True
-
-    while page_safety < 1000:  # hard cap
-        raw = await run_client_call(
-            client.list_survey_responses_guide,
-            created_at_start_ms=created_at_start_ms,
-            created_at_end_ms=created_at_end_ms,
+    (
+        created_at_start_ms, created_at_end_ms, subject_ticket_ids, responder_ids,
+        rating_min, rating_max, rating_category, has_comment, cursor,
+    ) = _extract(arguments, optional=(*_SURVEY_ARGS, ("cursor", None)))
+
+    include = _survey_filter(rating_category, rating_min, rating_max, has_comment)
+    need_comment = bool(has_comment)
+
+    # One SURVEY_PAGE_LIMIT budget for the whole count, however it is sharded
+    budget = _PageBudget(SURVEY_PAGE_LIMIT)
+
+    async def count_range(start_ms: int | None, end_ms: int | None, page_cursor: str | None) -> int:
+        count = 0
+        async with aclosing(_iter_survey_pages(
+            client,
+            cursor=page_cursor,
+            budget=budget,
+            created_at_start_ms=start_ms,
+            created_at_end_ms=end_ms,
             subject_ticket_ids=subject_ticket_ids,
             responder_ids=responder_ids,
-            cursor=cursor,
-        )
-        survey_responses = raw.get("survey_responses", [])
-        meta = raw.get("meta", {})
-
-        # normalize minimal fields for filtering
-        for r in survey_responses:
-            rating = None
-            comment = None
-            # answers
-            for ans in r.get("answers", []) or []:
-                if ans.get("type") == "rating_scale":
-                    try:
-                        rating = int(ans.get("rating") if ans.get("rating") is not None else ans.get("value"))
-                    except Exception:
-                        rating = None
-                elif ans.get("type") == "open_ended":
-                    comment = ans.get("value") or ans.get("text") or comment
-            item = {"rating": rating, "comment": comment}
-            if include_item(item):
-                total += 1
-
-        if not meta.get("has_more"):
-            break
-        cursor = meta.get("after_cursor") or meta.get("after")
-        if not cursor:
-            break
-        page_safety += 1
+            fields=("answers",),
+        )) as pages:
+            async for survey_responses in pages:
+                # comments are only read when filtered on
+                for r in survey_responses:
+                    rating, _, comment = _read_answers(r.get("answers"), need_comment)
+                    if include(rating, comment):
+                        count += 1
+        return count
+
+    # Cursor pages can only be walked one after another, so a bounded created_at
+    # window is split into disjoint shards that are each walked concurrently.
+    # Shards meet at end + 1 ms, which treats filter[created_at_end] as inclusive
+    # like the single walk does. All shards draw from the shared budget, so a busy
+    # shard keeps going while pages remain and the total never exceeds one walk's.
+    # A caller-supplied cursor belongs to one specific walk and can't be sharded.
+    if (
+        cursor is None
+        and created_at_start_ms is not None
+        and created_at_end_ms is not None
+        and created_at_end_ms - created_at_start_ms >= SURVEY_COUNT_SHARDS
+    ):
+        total = sum(await asyncio.gather(*(
+            count_range(shard_start, shard_end, None)
+            for shard_start, shard_end in _split_ms_range(
+                int(created_at_start_ms), int(created_at_end_ms), SURVEY_COUNT_SHARDS
+            )
+        )))
+    else:
+        total = await count_range(created_at_start_ms, created_at_end_ms, cursor)
 
     return _json_response({
         "total_count": total,
+        # True when the page budget ran out, so total_count is a lower bound
+        "truncated": budget.exhausted,
         "filter_applied": {
             "created_at_start_ms": created_at_start_ms,
             "created_at_end_ms": created_at_end_ms,
@@ -900,56 +1424,39 @@ async def handle_count_survey_responses_zendesk(client: Any, arguments: dict[str
 
 async def handle_get_sla_policies(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_sla_policies tool."""
-    result = await run_client_call(client.get_sla_policies)
-    return _json_response(result)
+    return await _cached_json_response(("get_sla_policies",), client.get_sla_policies)
 
 
 async def handle_get_sla_policy(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_sla_policy tool."""
     _require_args(arguments, "policy_id")
-    result = await run_client_call(client.get_sla_policy, int(arguments["policy_id"]))
-    return _json_response(result)
+    policy_id = int(arguments["policy_id"])
+    return await _cached_json_response(("get_sla_policy", policy_id), client.get_sla_policy, policy_id)
 
 
 async def handle_search_tickets_with_sla_breaches(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle search_tickets_with_sla_breaches tool."""
-    breach_type = arguments.get("breach_type") if arguments else None
-    status = arguments.get("status") if arguments else None
-    priority = arguments.get("priority") if arguments else None
-    limit = arguments.get("limit", 100) if arguments else 100
-
     result = await run_client_call(
         client.search_tickets_with_sla_breaches,
-        breach_type=breach_type,
-        status=status,
-        priority=priority,
-        limit=limit
+        **_merge_args("search_tickets_with_sla_breaches", arguments),
     )
     return _json_response(result)
 
 
 async def handle_get_tickets_at_risk_of_breach(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_tickets_at_risk_of_breach tool."""
-    status = arguments.get("status") if arguments else None
-    priority = arguments.get("priority") if arguments else None
-    limit = arguments.get("limit", 50) if arguments else 50
-
     result = await run_client_call(
         client.get_tickets_at_risk_of_breach,
-        status=status,
-        priority=priority,
-        limit=limit
+        **_merge_args("get_tickets_at_risk_of_breach", arguments),
     )
     return _json_response(result)
 
 
 async def handle_get_recent_tickets_with_csat(client: Any, arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Handle get_recent_tickets_with_csat tool."""
-    limit = arguments.get("limit", 20) if arguments else 20
-
     result = await run_client_call(
         client.get_recent_tickets_with_csat,
-        limit=limit
+        **_merge_args("get_recent_tickets_with_csat", arguments),
     )
     return _json_response(result)
 
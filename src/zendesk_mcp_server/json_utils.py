@@ -0,0 +1,15 @@
+"""JSON serialization shared by the server resources and the tool handlers."""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup for large payloads
+    orjson = None
+
+
+def json_raw(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
@@ -1,39 +1,150 @@
 import asyncio
-import json
+import functools
 import logging
 import os
-from typing import Any, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar
 
-from cachetools.func import ttl_cache
-from dotenv import load_dotenv
 from mcp.server import InitializationOptions, NotificationOptions
 from mcp.server import Server, types
 from mcp.server.stdio import stdio_server
 from pydantic import AnyUrl
 
-from zendesk_mcp_server.zendesk_client import ZendeskClient
+from zendesk_mcp_server.exports import export_uri, list_exports, read_export
+from zendesk_mcp_server.json_utils import json_raw
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-logger = logging.getLogger("zendesk-mcp-server")
-logger.info("zendesk mcp server started")
+try:
+    import uvloop
+except ImportError:  # optional faster event loop
+    uvloop = None
 
-load_dotenv()
-zendesk_client = ZendeskClient(
-    subdomain=os.getenv("ZENDESK_SUBDOMAIN"),
-    email=os.getenv("ZENDESK_EMAIL"),
-    token=os.getenv("ZENDESK_API_KEY")
-)
+if TYPE_CHECKING:
+    from zendesk_mcp_server.zendesk_client import ZendeskClient
+
+LOGGER_NAME = "zendesk-mcp-server"
+logger = logging.getLogger(LOGGER_NAME)
+
+# Required configuration, mapped to a short description used in error messages
+REQUIRED_ENV_VARS: Dict[str, str] = {
+    "ZENDESK_SUBDOMAIN": "Zendesk subdomain (the <subdomain> in <subdomain>.zendesk.com)",
+    "ZENDESK_EMAIL": "agent email used for API token authentication",
+    "ZENDESK_API_KEY": "Zendesk API token",
+}
 
 server = Server("Zendesk Server")
 
+T = TypeVar("T")
+
+# Event loop factory for asyncio.run: uvloop when installed, else the asyncio default
+EVENT_LOOP_FACTORY: Callable[[], asyncio.AbstractEventLoop] | None = uvloop.new_event_loop if uvloop is not None else None
+
+_client_executor: ThreadPoolExecutor | None = None
+
+# Knowledge-base resource body and its expiry (time.monotonic), refreshed under _kb_lock
+KB_CACHE_TTL_SECONDS = 3600
+_kb_cache: Dict[str, Any] = {"json": None, "expires": 0.0}
+_kb_lock = asyncio.Lock()
+
+
+def configure_logging() -> None:
+    """Attach a single stderr handler to the server logger.
+
+    Safe to call repeatedly; stdout is reserved for the MCP stdio transport.
+    """
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    logger.addHandler(handler)
+    logger.setLevel(os.getenv("PYTHONLOGLEVEL", "INFO").upper())
+    logger.propagate = False
+
+
+@functools.lru_cache(maxsize=1)
+def load_env_file() -> bool:
+    """Load a .env file into the environment once; variables already set win.
+
+    Deployments that inject the environment directly can set
+    ZENDESK_MCP_LOAD_DOTENV=0 to skip the .env lookup (and the dotenv import).
+    """
+    if os.getenv("ZENDESK_MCP_LOAD_DOTENV", "1") == "0":
+        return False
+    # Imported here: dotenv is only needed once, at startup
+    from dotenv import load_dotenv
+
+    return load_dotenv()
+
+
+def load_settings() -> Dict[str, str]:
+    """Read required settings from the environment, raising if any are missing."""
+    settings = {key: os.getenv(key) for key in REQUIRED_ENV_VARS}
+    missing = [f"{key} ({desc})" for key, desc in REQUIRED_ENV_VARS.items() if not settings[key]]
+    if missing:
+        raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
+    return settings
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Dict[str, str]:
+    """Return cached settings, loading them (and any .env file) on first use."""
+    load_env_file()
+    return load_settings()
+
+
+@functools.lru_cache(maxsize=1)
+def get_zendesk_client() -> "ZendeskClient":
+    """Return the process-wide ZendeskClient, creating it on first use.
+
+    The client owns a pooled keep-alive HTTP session, so it is built once and
+    shared by every tool call; handlers must never close or rebuild it.
+    """
+    # Imported here so listing tools and prompts never loads zenpy and requests
+    from zendesk_mcp_server.zendesk_client import ZendeskClient
+
+    settings = get_settings()
+    return ZendeskClient(
+        subdomain=settings["ZENDESK_SUBDOMAIN"],
+        email=settings["ZENDESK_EMAIL"],
+        token=settings["ZENDESK_API_KEY"],
+    )
+
+
+def get_client_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool used for blocking client calls."""
+    global _client_executor
+    if _client_executor is None:
+        from zendesk_mcp_server.client.base import HTTP_POOL_MAXSIZE
+
+        # The work is I/O-bound HTTPS round trips, so the pool is wider than
+        # asyncio's default executor; override with ZENDESK_MCP_THREAD_POOL_SIZE.
+        workers = os.getenv("ZENDESK_MCP_THREAD_POOL_SIZE")
+        _client_executor = ThreadPoolExecutor(
+            max_workers=int(workers) if workers else max(HTTP_POOL_MAXSIZE, (os.cpu_count() or 1) * 5),
+            thread_name_prefix="zendesk-io",
+        )
+    return _client_executor
+
+
+async def run_client_call(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking client call on the shared client thread pool to keep the event loop responsive.
+
+    Unlike asyncio.to_thread, the caller's context is not copied; nothing in
+    the server or client uses contextvars.
+    """
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        return await loop.run_in_executor(get_client_executor(), functools.partial(func, *args, **kwargs))
+    return await loop.run_in_executor(get_client_executor(), func, *args)
+
+
 TICKET_ANALYSIS_TEMPLATE = """
 You are a helpful Zendesk support analyst. You've been asked to analyze ticket #{ticket_id}.
 
-Please fetch the ticket info and comments to analyze it and provide:
+Please fetch the ticket info and comments (get_ticket_context returns both in one call) to analyze it and provide:
 1. A summary of the issue
 2. The current status and timeline
 3. Key points of interaction
@@ -44,7 +155,7 @@ Remember to be professional and focus on actionable insights.
 COMMENT_DRAFT_TEMPLATE = """
 You are a helpful Zendesk support agent. You need to draft a response to ticket #{ticket_id}.
 
-Please fetch the ticket info, comments and knowledge base to draft a professional and helpful response that:
+Please fetch the ticket info, comments and knowledge base (get_ticket_context returns all three in one call) to draft a professional and helpful response that:
 1. Acknowledges the customer's concern
 2. Addresses the specific issues raised
 3. Provides clear next steps or ask for specific details need to proceed
@@ -54,79 +165,138 @@ Please fetch the ticket info, comments and knowledge base to draft a professiona
 The response should be formatted well and ready to be posted as a comment.
 """
 
+# Stripped once here rather than on every prompt request
+TICKET_ANALYSIS_TEMPLATE = TICKET_ANALYSIS_TEMPLATE.strip()
+COMMENT_DRAFT_TEMPLATE = COMMENT_DRAFT_TEMPLATE.strip()
+
+# Each template holds a single {ticket_id} placeholder; pre-split around it so a
+# prompt is a plain concatenation instead of a str.format parse per request.
+_TICKET_ANALYSIS_PREFIX, _TICKET_ANALYSIS_SUFFIX = TICKET_ANALYSIS_TEMPLATE.split("{ticket_id}")
+_COMMENT_DRAFT_PREFIX, _COMMENT_DRAFT_SUFFIX = COMMENT_DRAFT_TEMPLATE.split("{ticket_id}")
+
+
+def _build_analyze_prompt(ticket_id: int) -> tuple[str, str]:
+    return (
+        f"{_TICKET_ANALYSIS_PREFIX}{ticket_id}{_TICKET_ANALYSIS_SUFFIX}",
+        f"Analysis prompt for ticket #{ticket_id}",
+    )
+
+
+def _build_draft_prompt(ticket_id: int) -> tuple[str, str]:
+    return (
+        f"{_COMMENT_DRAFT_PREFIX}{ticket_id}{_COMMENT_DRAFT_SUFFIX}",
+        f"Response draft prompt for ticket #{ticket_id}",
+    )
+
+
+# Prompt name -> builder returning (prompt text, description)
+_PROMPT_BUILDERS: Dict[str, Callable[[int], tuple[str, str]]] = {
+    "analyze-ticket": _build_analyze_prompt,
+    "draft-ticket-response": _build_draft_prompt,
+}
+
+
+# Prompt definitions are static, so they are built and validated once at import
+_PROMPTS: list[types.Prompt] = [
+    types.Prompt(
+        name="analyze-ticket",
+        description="Analyze a Zendesk ticket and provide insights",
+        arguments=[
+            types.PromptArgument(
+                name="ticket_id",
+                description="The ID of the ticket to analyze",
+                required=True,
+            )
+        ],
+    ),
+    types.Prompt(
+        name="draft-ticket-response",
+        description="Draft a professional response to a Zendesk ticket",
+        arguments=[
+            types.PromptArgument(
+                name="ticket_id",
+                description="The ID of the ticket to respond to",
+                required=True,
+            )
+        ],
+    )
+]
+
 
 @server.list_prompts()
 async def handle_list_prompts() -> list[types.Prompt]:
     """List available prompts"""
-    return [
-        types.Prompt(
-            name="analyze-ticket",
-            description="Analyze a Zendesk ticket and provide insights",
-            arguments=[
-                types.PromptArgument(
-                    name="ticket_id",
-                    description="The ID of the ticket to analyze",
-                    required=True,
-                )
-            ],
-        ),
-        types.Prompt(
-            name="draft-ticket-response",
-            description="Draft a professional response to a Zendesk ticket",
-            arguments=[
-                types.PromptArgument(
-                    name="ticket_id",
-                    description="The ID of the ticket to respond to",
-                    required=True,
-                )
-            ],
-        )
-    ]
+    return _PROMPTS
 
 
 @server.get_prompt()
 async def handle_get_prompt(name: str, arguments: Dict[str, str] | None) -> types.GetPromptResult:
     """Handle prompt requests"""
-    if not arguments or "ticket_id" not in arguments:
-        raise ValueError("Missing required argument: ticket_id")
+    builder = _PROMPT_BUILDERS.get(name)
+    if builder is None:
+        raise ValueError(f"Unknown prompt: {name}")
 
-    ticket_id = int(arguments["ticket_id"])
-    try:
-        if name == "analyze-ticket":
-            prompt = TICKET_ANALYSIS_TEMPLATE.format(
-                ticket_id=ticket_id
-            )
-            description = f"Analysis prompt for ticket #{ticket_id}"
-
-        elif name == "draft-ticket-response":
-            prompt = COMMENT_DRAFT_TEMPLATE.format(
-                ticket_id=ticket_id
+    ticket_id = arguments.get("ticket_id") if arguments else None
+    if ticket_id is None:
+        raise ValueError("Missing required argument: ticket_id")
+    # Prompt arguments arrive as strings; check digits up front rather than relying on int() raising
+    if isinstance(ticket_id, str) and ticket_id.isascii() and ticket_id.isdigit():
+        ticket_id = int(ticket_id)
+    elif not isinstance(ticket_id, int) or isinstance(ticket_id, bool):
+        raise ValueError(f"Invalid ticket_id: {ticket_id!r}")
+
+    prompt, description = builder(ticket_id)
+    return types.GetPromptResult(
+        description=description,
+        messages=[
+            types.PromptMessage(
+                role="user",
+                content=types.TextContent(type="text", text=prompt),
             )
-            description = f"Response draft prompt for ticket #{ticket_id}"
-
-        else:
-            raise ValueError(f"Unknown prompt: {name}")
-
-        return types.GetPromptResult(
-            description=description,
-            messages=[
-                types.PromptMessage(
-                    role="user",
-                    content=types.TextContent(type="text", text=prompt.strip()),
-                )
-            ],
-        )
-
-    except Exception as e:
-        logger.error(f"Error generating prompt: {e}")
-        raise
-
-
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available Zendesk tools"""
+        ],
+    )
+
+
+_TICKET_ID_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ticket_id": {"type": "integer", "description": "The ID of the ticket"}
+    },
+    "required": ["ticket_id"]
+}
+
+_SORT_PROPERTIES = {
+    "sort_by": {"type": "string", "description": "Field to sort by (e.g. created_at, updated_at, priority, status)"},
+    "sort_order": {"type": "string", "description": "Sort order (asc or desc)"},
+}
+
+_LIMIT_PROPERTIES = {
+    "limit": {"type": "integer", "description": "Maximum results", "default": 100},
+}
+
+_NO_ARGS_SCHEMA = {"type": "object", "properties": {}, "required": []}
+
+_SURVEY_RESPONSE_PROPERTIES = {
+    "created_at_start_ms": {"type": "integer", "description": "Only responses submitted at or after this epoch millisecond"},
+    "created_at_end_ms": {"type": "integer", "description": "Only responses submitted at or before this epoch millisecond"},
+    "subject_ticket_ids": {"type": "array", "items": {"type": "integer"}, "description": "Restrict to these ticket IDs"},
+    "responder_ids": {"type": "array", "items": {"type": "integer"}, "description": "Restrict to these responder user IDs"},
+    "rating_min": {"type": "integer", "description": "Minimum rating (1-5)"},
+    "rating_max": {"type": "integer", "description": "Maximum rating (1-5)"},
+    "rating_category": {"type": "string", "description": "good (>=4) or bad (<=2)"},
+    "has_comment": {"type": "boolean", "description": "Only responses with a free-text comment", "default": False},
+    "cursor": {"type": "string", "description": "Pagination cursor from a previous call"},
+}
+
+
+def _build_tools() -> list[types.Tool]:
+    """Build the Zendesk tool definitions advertised by list_tools.
+
+    The definitions are trusted literals, so model_construct skips validating
+    each nested inputSchema; tests cover their shape.
+    """
     return [
-        types.Tool(
+        types.Tool.model_construct(
             name="get_ticket",
             description="Retrieve a Zendesk ticket by its ID",
             inputSchema={
@@ -140,7 +310,7 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["ticket_id"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="create_ticket",
             description="Create a new Zendesk ticket",
             inputSchema={
@@ -158,7 +328,7 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["subject", "description"],
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="get_tickets",
             description="Fetch the latest tickets with pagination support",
             inputSchema={
@@ -188,7 +358,7 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": []
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="get_ticket_comments",
             description="Retrieve all comments for a Zendesk ticket by its ID",
             inputSchema={
@@ -202,7 +372,7 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["ticket_id"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="create_ticket_comment",
             description="Create a new comment on an existing Zendesk ticket",
             inputSchema={
@@ -225,7 +395,7 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["ticket_id", "comment"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="update_ticket",
             description="Update fields on an existing Zendesk ticket (e.g., status, priority, assignee_id)",
             inputSchema={
@@ -244,102 +414,480 @@ async def handle_list_tools() -> list[types.Tool]:
                 },
                 "required": ["ticket_id"]
             }
-        )
+        ),
+        types.Tool.model_construct(
+            name="search_tickets",
+            description="Search tickets with Zendesk search syntax (up to 1000 results)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Zendesk search query, e.g. 'status:open priority:high'"},
+                    **_SORT_PROPERTIES,
+                    "limit": {"type": "integer", "description": "Maximum results (max 1000)", "default": 100},
+                },
+                "required": ["query"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="search_tickets_export",
+            description=(
+                "Search tickets with the export API (no 1000-result cap). Over 1000 tickets, the result "
+                "is split across several text items: a summary with a 'chunks' count, then ticket slices"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Zendesk search query"},
+                    **_SORT_PROPERTIES,
+                    "max_results": {"type": "integer", "description": "Optional cap on results"},
+                    "output_file": {
+                        "type": "boolean",
+                        "description": "Store the tickets as a JSON Lines resource and return its zendesk://exports/ URI with a short preview",
+                        "default": False
+                    },
+                },
+                "required": ["query"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="upload_attachment",
+            description="Upload a local file to Zendesk and return its upload token",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "file_path": {"type": "string", "description": "Path of the file to upload"}
+                },
+                "required": ["file_path"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_ticket_attachments",
+            description="List all attachments on a ticket's comments",
+            inputSchema=_TICKET_ID_SCHEMA
+        ),
+        types.Tool.model_construct(
+            name="download_attachment",
+            description="Get attachment metadata and optionally save the file locally",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "attachment_id": {"type": "integer", "description": "The ID of the attachment"},
+                    "save_path": {"type": "string", "description": "Optional local path to save the file"}
+                },
+                "required": ["attachment_id"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="search_kb_articles",
+            description="Search Help Center articles",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search term"},
+                    "labels": {"type": "array", "items": {"type": "string"}, "description": "Restrict to articles with these labels"},
+                    "section_id": {"type": "integer", "description": "Restrict to a section"},
+                    "limit": {"type": "integer", "description": "Maximum results", "default": 10},
+                    "sort_by": {"type": "string", "description": "relevance, created_at or updated_at", "default": "relevance"}
+                },
+                "required": ["query"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_kb_article",
+            description="Retrieve a Help Center article by its ID",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "article_id": {"type": "integer", "description": "The ID of the article"}
+                },
+                "required": ["article_id"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="search_kb_by_labels",
+            description="Find Help Center articles by label",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "labels": {"type": "array", "items": {"type": "string"}, "description": "Labels to match"},
+                    "limit": {"type": "integer", "description": "Maximum results", "default": 10}
+                },
+                "required": ["labels"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="list_kb_sections",
+            description="List Help Center sections",
+            inputSchema=_NO_ARGS_SCHEMA
+        ),
+        types.Tool.model_construct(
+            name="find_related_tickets",
+            description="Find tickets related by subject similarity, requester, or organization",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ticket_id": {"type": "integer", "description": "Reference ticket ID"},
+                    **_LIMIT_PROPERTIES
+                },
+                "required": ["ticket_id"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="find_duplicate_tickets",
+            description="Identify potential duplicates of a ticket",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ticket_id": {"type": "integer", "description": "Reference ticket ID"},
+                    **_LIMIT_PROPERTIES
+                },
+                "required": ["ticket_id"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="find_ticket_thread",
+            description="Find all tickets in the same conversation thread",
+            inputSchema=_TICKET_ID_SCHEMA
+        ),
+        types.Tool.model_construct(
+            name="get_ticket_relationships",
+            description="Get parent/child/sibling relationships for a ticket",
+            inputSchema=_TICKET_ID_SCHEMA
+        ),
+        types.Tool.model_construct(
+            name="get_ticket_fields",
+            description="Retrieve all ticket field definitions",
+            inputSchema=_NO_ARGS_SCHEMA
+        ),
+        types.Tool.model_construct(
+            name="search_by_source",
+            description="Search tickets by creation channel (email, web, api, chat, voice, ...)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "channel": {"type": "string", "description": "Creation channel"},
+                    **_SORT_PROPERTIES,
+                    **_LIMIT_PROPERTIES
+                },
+                "required": ["channel"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="search_tickets_enhanced",
+            description="Search tickets with client-side regex, fuzzy, and proximity filtering",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Base Zendesk search query"},
+                    "regex_pattern": {"type": "string", "description": "Regex applied to subject and description"},
+                    "fuzzy_term": {"type": "string", "description": "Term for fuzzy subject matching"},
+                    "fuzzy_threshold": {"type": "number", "description": "Similarity threshold 0.0-1.0", "default": 0.7},
+                    "proximity_terms": {"type": "array", "items": {"type": "string"}, "description": "Terms that must appear near each other"},
+                    "proximity_distance": {"type": "integer", "description": "Maximum words between terms", "default": 5},
+                    **_SORT_PROPERTIES,
+                    **_LIMIT_PROPERTIES
+                },
+                "required": ["query"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="build_search_query",
+            description="Build a Zendesk search query string from structured filters",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "status": {"type": "string"},
+                    "priority": {"type": "string"},
+                    "assignee": {"type": "string"},
+                    "requester": {"type": "string"},
+                    "organization": {"type": "string"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                    "tags_logic": {"type": "string", "description": "AND or OR", "default": "OR"},
+                    "exclude_tags": {"type": "array", "items": {"type": "string"}},
+                    "created_after": {"type": "string", "description": "YYYY-MM-DD"},
+                    "created_before": {"type": "string", "description": "YYYY-MM-DD"},
+                    "updated_after": {"type": "string", "description": "YYYY-MM-DD"},
+                    "updated_before": {"type": "string", "description": "YYYY-MM-DD"},
+                    "solved_after": {"type": "string", "description": "YYYY-MM-DD"},
+                    "solved_before": {"type": "string", "description": "YYYY-MM-DD"},
+                    "due_after": {"type": "string", "description": "YYYY-MM-DD"},
+                    "due_before": {"type": "string", "description": "YYYY-MM-DD"},
+                    "custom_fields": {"type": "object", "description": "Map of custom field ID to value"},
+                    "subject_contains": {"type": "string"},
+                    "description_contains": {"type": "string"},
+                    "comment_contains": {"type": "string"}
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_search_statistics",
+            description="Aggregate statistics (status, priority, assignee, tags, resolution times) for a search",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Zendesk search query"},
+                    **_SORT_PROPERTIES,
+                    "limit": {"type": "integer", "description": "Tickets to analyze", "default": 1000}
+                },
+                "required": ["query"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="search_by_date_range",
+            description="Search tickets by a custom or relative date range",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "date_field": {"type": "string", "description": "created, updated, solved or due", "default": "created"},
+                    "range_type": {"type": "string", "description": "custom or relative", "default": "custom"},
+                    "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+                    "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+                    "relative_period": {
+                        "type": "string",
+                        "description": "last_7_days, last_30_days, this_month, last_month, this_quarter, last_quarter"
+                    },
+                    **_SORT_PROPERTIES,
+                    **_LIMIT_PROPERTIES
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="search_by_tags_advanced",
+            description="Search tickets by tags with AND/OR/NOT logic",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "include_tags": {"type": "array", "items": {"type": "string"}},
+                    "exclude_tags": {"type": "array", "items": {"type": "string"}},
+                    "tag_logic": {"type": "string", "description": "AND or OR for include_tags", "default": "OR"},
+                    **_SORT_PROPERTIES,
+                    **_LIMIT_PROPERTIES
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="batch_search_tickets",
+            description=(
+                "Run several ticket searches concurrently and merge the results. Over 1000 tickets, the result "
+                "is split across several text items: a summary with a 'chunks' count, then one item per query "
+                "followed by all_tickets slices"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "queries": {"type": "array", "items": {"type": "string"}, "description": "Zendesk search queries"},
+                    "deduplicate": {"type": "boolean", "description": "Drop tickets returned by more than one query", "default": True},
+                    **_SORT_PROPERTIES,
+                    "limit_per_query": {"type": "integer", "description": "Maximum results per query", "default": 100}
+                },
+                "required": ["queries"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_ticket_bundle_zendesk",
+            description="Get a ticket with comments, audits, requester, and organization in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ticket_id": {"type": "integer", "description": "The ID of the ticket"},
+                    "comment_limit": {"type": "integer", "description": "Maximum comments", "default": 50},
+                    "audit_limit": {"type": "integer", "description": "Maximum audits", "default": 100}
+                },
+                "required": ["ticket_id"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_ticket_context",
+            description="Get a ticket, its comments, and related knowledge base articles in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ticket_id": {"type": "integer", "description": "The ID of the ticket"},
+                    "kb_query": {"type": "string", "description": "Knowledge base search query (defaults to the ticket subject)"},
+                    "kb_limit": {"type": "integer", "description": "Maximum knowledge base articles", "default": 5}
+                },
+                "required": ["ticket_id"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_case_volume_analytics",
+            description="Aggregate ticket volume and metrics by time bucket, technician, and other dimensions",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "start_date": {"type": "string", "description": "YYYY-MM-DD (inclusive)"},
+                    "end_date": {"type": "string", "description": "YYYY-MM-DD (inclusive, defaults to today)"},
+                    "max_results": {"type": "integer", "description": "Safety cap on tickets analyzed"},
+                    "include_metrics": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "response_times, resolution_times, channels, forms, assignments, status_transitions, satisfaction, first_response_sla, csat_survey"
+                    },
+                    "group_by": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "channel, form, priority, type, group_id, tags, requester, organization, custom_fields"
+                    },
+                    "filter_by_status": {"type": "array", "items": {"type": "string"}},
+                    "filter_by_priority": {"type": "array", "items": {"type": "string"}},
+                    "filter_by_tags": {"type": "array", "items": {"type": "string"}},
+                    "filter_by_csat_score": {"type": "string", "description": "low (<=2) or high (>=4)"},
+                    "filter_by_sla_breach": {"type": "boolean"},
+                    "filter_by_organization_id": {"type": "integer"},
+                    "filter_by_custom_field": {"type": "object", "description": "{'field_id': ..., 'value': ...}"},
+                    "time_bucket": {"type": "string", "description": "daily, weekly or monthly", "default": "weekly"}
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_ticket_sla_status",
+            description="Get SLA policy, breach, and time-remaining status for a ticket",
+            inputSchema=_TICKET_ID_SCHEMA
+        ),
+        types.Tool.model_construct(
+            name="search_tickets_by_csat",
+            description="Find tickets by CSAT score, optionally filtered by rating date, organization, custom field, or comment presence",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "csat_score": {"type": "string", "description": "low (1-2), high (4-5) or any"},
+                    "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+                    "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+                    "organization_id": {"type": "integer"},
+                    "custom_field": {"type": "object", "description": "{'field_id': ..., 'value': ...}"},
+                    **_LIMIT_PROPERTIES,
+                    "filter_by_rating_date": {
+                        "type": "boolean",
+                        "description": "Apply dates to when the survey was answered instead of ticket creation",
+                        "default": False
+                    },
+                    "has_comment": {"type": "boolean", "description": "Only ratings with a comment", "default": False}
+                },
+                "required": ["csat_score"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="list_survey_responses_zendesk",
+            description="List CSAT survey responses filtered by submission time, rating, and comment presence",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **_SURVEY_RESPONSE_PROPERTIES,
+                    "limit": {"type": "integer", "description": "Page size to request (at most 100); filters apply within that page, so fewer may be returned and next_cursor continues after it"},
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="count_survey_responses_zendesk",
+            description=(
+                "Count CSAT survey responses matching the same filters as list_survey_responses_zendesk; "
+                "truncated=true means the page limit was reached and total_count is a lower bound"
+            ),
+            inputSchema={"type": "object", "properties": dict(_SURVEY_RESPONSE_PROPERTIES), "required": []}
+        ),
+        types.Tool.model_construct(
+            name="get_sla_policies",
+            description="List all SLA policies",
+            inputSchema=_NO_ARGS_SCHEMA
+        ),
+        types.Tool.model_construct(
+            name="get_sla_policy",
+            description="Get a specific SLA policy",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "policy_id": {"type": "integer", "description": "The ID of the SLA policy"}
+                },
+                "required": ["policy_id"]
+            }
+        ),
+        types.Tool.model_construct(
+            name="search_tickets_with_sla_breaches",
+            description="Find tickets that have breached an SLA target",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "breach_type": {"type": "string", "description": "first_reply_time, next_reply_time or resolution_time"},
+                    "status": {"type": "string"},
+                    "priority": {"type": "string"},
+                    **_LIMIT_PROPERTIES
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_tickets_at_risk_of_breach",
+            description="Find tickets approaching an SLA breach",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "status": {"type": "string"},
+                    "priority": {"type": "string"},
+                    "limit": {"type": "integer", "description": "Maximum results", "default": 50}
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_recent_tickets_with_csat",
+            description="Get the most recent tickets that have a CSAT rating",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "limit": {"type": "integer", "description": "Maximum results", "default": 20}
+                },
+                "required": []
+            }
+        ),
+        types.Tool.model_construct(
+            name="get_tickets_with_csat_this_week",
+            description="Get this week's tickets that have a CSAT rating",
+            inputSchema=_NO_ARGS_SCHEMA
+        ),
     ]
 
 
+# Tool definitions are static, so they are built once at import
+_TOOLS: list[types.Tool] = _build_tools()
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available Zendesk tools"""
+    return _TOOLS
+
+
+# Tool name -> handler map, resolved on the first call_tool request
+_tool_handlers: Dict[str, Callable[..., Any]] | None = None
+
+
 @server.call_tool()
 async def handle_call_tool(
         name: str,
         arguments: dict[str, Any] | None
 ) -> list[types.TextContent]:
     """Handle Zendesk tool execution requests"""
-    try:
-        if name == "get_ticket":
-            if not arguments:
-                raise ValueError("Missing arguments")
-            ticket = zendesk_client.get_ticket(arguments["ticket_id"])
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(ticket)
-            )]
-
-        elif name == "create_ticket":
-            if not arguments:
-                raise ValueError("Missing arguments")
-            created = zendesk_client.create_ticket(
-                subject=arguments.get("subject"),
-                description=arguments.get("description"),
-                requester_id=arguments.get("requester_id"),
-                assignee_id=arguments.get("assignee_id"),
-                priority=arguments.get("priority"),
-                type=arguments.get("type"),
-                tags=arguments.get("tags"),
-                custom_fields=arguments.get("custom_fields"),
-            )
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({"message": "Ticket created successfully", "ticket": created}, indent=2)
-            )]
-
-        elif name == "get_tickets":
-            page = arguments.get("page", 1) if arguments else 1
-            per_page = arguments.get("per_page", 25) if arguments else 25
-            sort_by = arguments.get("sort_by", "created_at") if arguments else "created_at"
-            sort_order = arguments.get("sort_order", "desc") if arguments else "desc"
-
-            tickets = zendesk_client.get_tickets(
-                page=page,
-                per_page=per_page,
-                sort_by=sort_by,
-                sort_order=sort_order
-            )
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(tickets, indent=2)
-            )]
-
-        elif name == "get_ticket_comments":
-            if not arguments:
-                raise ValueError("Missing arguments")
-            comments = zendesk_client.get_ticket_comments(
-                arguments["ticket_id"])
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(comments)
-            )]
-
-        elif name == "create_ticket_comment":
-            if not arguments:
-                raise ValueError("Missing arguments")
-            public = arguments.get("public", True)
-            result = zendesk_client.post_comment(
-                ticket_id=arguments["ticket_id"],
-                comment=arguments["comment"],
-                public=public
-            )
-            return [types.TextContent(
-                type="text",
-                text=f"Comment created successfully: {result}"
-            )]
-
-        elif name == "update_ticket":
-            if not arguments:
-                raise ValueError("Missing arguments")
-            ticket_id = arguments.get("ticket_id")
-            if ticket_id is None:
-                raise ValueError("ticket_id is required")
-            update_fields = {k: v for k, v in arguments.items() if k != "ticket_id"}
-            updated = zendesk_client.update_ticket(ticket_id=int(ticket_id), **update_fields)
-            return [types.TextContent(
-                type="text",
-                text=json.dumps({"message": "Ticket updated successfully", "ticket": updated}, indent=2)
-            )]
-
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+    global _tool_handlers
+    handlers = _tool_handlers
+    if handlers is None:
+        # Imported here: the handlers import run_client_call from this module
+        from zendesk_mcp_server.handlers import TOOL_HANDLERS
+        handlers = _tool_handlers = TOOL_HANDLERS
+
+    handler = handlers.get(name)
+    if handler is None:
+        logger.error("Unknown tool: %s", name)
+        return [types.TextContent(type="text", text=f"Error: Unknown tool: {name}")]
 
+    try:
+        return await handler(get_zendesk_client(), arguments)
     except Exception as e:
+        logger.exception("Error in tool %s", name)
         return [types.TextContent(
             type="text",
             text=f"Error: {str(e)}"
@@ -355,57 +903,97 @@ async def handle_list_resources() -> list[types.Resource]:
             name="Zendesk Knowledge Base",
             description="Access to Zendesk Help Center articles and sections",
             mimeType="application/json",
-        )
+        ),
+        *(
+            types.Resource(
+                uri=AnyUrl(export_uri(export_id)),
+                name=f"Ticket export {export_id}",
+                description="search_tickets_export results, one ticket per line",
+                mimeType="application/x-ndjson",
+            )
+            for export_id in await run_client_call(list_exports)
+        ),
     ]
 
 
-@ttl_cache(ttl=3600)
-def get_cached_kb():
-    return zendesk_client.get_all_articles()
+def _fetch_kb_json() -> str:
+    """Fetch every help center article and serialize the knowledge-base resource body."""
+    kb_data = get_zendesk_client().get_all_articles()
+    return json_raw({
+        "knowledge_base": kb_data,
+        "metadata": {
+            "sections": len(kb_data),
+            "total_articles": sum(len(section['articles']) for section in kb_data.values()),
+        }
+    }).decode()
+
+
+async def get_cached_kb_json() -> str:
+    """Return the knowledge-base resource body, fetched and serialized at most once per KB_CACHE_TTL_SECONDS.
+
+    Concurrent misses wait on the lock and share the one refresh instead of
+    each paging through the whole help center.
+    """
+    if _kb_cache["json"] is not None and time.monotonic() < _kb_cache["expires"]:
+        return _kb_cache["json"]
+    async with _kb_lock:
+        if _kb_cache["json"] is None or time.monotonic() >= _kb_cache["expires"]:
+            _kb_cache["json"] = await run_client_call(_fetch_kb_json)
+            _kb_cache["expires"] = time.monotonic() + KB_CACHE_TTL_SECONDS
+    return _kb_cache["json"]
 
 
 @server.read_resource()
 async def handle_read_resource(uri: AnyUrl) -> str:
-    logger.debug(f"Handling read_resource request for URI: {uri}")
+    logger.debug("Handling read_resource request for URI: %s", uri)
     if uri.scheme != "zendesk":
         logger.error(f"Unsupported URI scheme: {uri.scheme}")
         raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
 
     path = str(uri).replace("zendesk://", "")
+    if path.startswith("exports/"):
+        return await run_client_call(read_export, path.removeprefix("exports/"))
     if path != "knowledge-base":
         logger.error(f"Unknown resource path: {path}")
         raise ValueError(f"Unknown resource path: {path}")
 
     try:
-        kb_data = get_cached_kb()
-        return json.dumps({
-            "knowledge_base": kb_data,
-            "metadata": {
-                "sections": len(kb_data),
-                "total_articles": sum(len(section['articles']) for section in kb_data.values()),
-            }
-        }, indent=2)
+        return await get_cached_kb_json()
     except Exception as e:
         logger.error(f"Error fetching knowledge base: {e}")
         raise
 
 
 async def main():
-    # Run the server using stdin/stdout streams
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream=read_stream,
-            write_stream=write_stream,
-            initialization_options=InitializationOptions(
-                server_name="Zendesk",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    load_env_file()
+    configure_logging()
+    logger.info("zendesk mcp server started")
+    # Fail fast on missing configuration and warm the shared client before serving
+    get_zendesk_client()
+
+    # Route plain asyncio.to_thread calls (e.g. inside the client) through the same pool
+    executor = get_client_executor()
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    try:
+        # Run the server using stdin/stdout streams
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream=read_stream,
+                write_stream=write_stream,
+                initialization_options=InitializationOptions(
+                    server_name="Zendesk",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await get_zendesk_client().aclose()
+        executor.shutdown(wait=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=EVENT_LOOP_FACTORY)
@@ -61,3 +61,38 @@ def test_batch_search_limited_to_three_concurrent(monkeypatch):
     # The max observed concurrency should not exceed 3 due to the semaphore
     assert max_concurrency <= 3
 
+
+
+def test_find_related_tickets_runs_searches_concurrently(monkeypatch):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.zendesk_client import ZendeskClient
+
+    def fake_init(self, subdomain, email, token):
+        self.client = types.SimpleNamespace()
+        self.base_url = "https://example"
+        self.auth_header = "Basic xxx"
+
+    monkeypatch.setattr(ZendeskClient, "__init__", fake_init, raising=False)
+
+    # Every search waits until all three have started, so a sequential
+    # implementation would time out at the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_export(self, query, **kwargs):
+        barrier.wait()
+        ticket_id = {"s": 11, "r": 12, "o": 13}[query.split(":")[0][0]]
+        return {"tickets": [{"id": ticket_id, "subject": "printer jam", "updated_at": "2024-01-01T00:00:00Z"}]}
+
+    monkeypatch.setattr(ZendeskClient, "search_tickets_export", fake_export, raising=False)
+    monkeypatch.setattr(
+        ZendeskClient,
+        "get_ticket",
+        lambda self, ticket_id: {"id": ticket_id, "subject": "printer jam again", "requester_id": 5, "organization_id": 6},
+        raising=False,
+    )
+
+    out = ZendeskClient("s", "e", "t").find_related_tickets(1, limit=10)
+
+    reasons = {t["id"]: t["relevance_reason"] for t in out["related_tickets"]}
+    assert reasons == {11: "similar_subject", 12: "same_requester", 13: "same_organization"}
+    assert "failed" not in out["search_strategy"]
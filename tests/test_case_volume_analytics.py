@@ -14,6 +14,9 @@ class TestCaseVolumeAnalytics:
     def setup_method(self):
         self.client = ZendeskClient("test", "test", "test")
         self.client.client = Mock()
+        # No network: incremental metric events and survey lookups come back empty
+        self.client._get_json = Mock(return_value={})
+        self.client._get_json_url = Mock(return_value={})
 
     def test_get_case_volume_analytics_basic(self):
         """Aggregate weekly, monthly, and technician counts within a range."""
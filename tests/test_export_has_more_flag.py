@@ -41,10 +41,15 @@ def test_search_tickets_export_has_more_flag(monkeypatch):
         # Stub zenpy client's search_export to yield 10 tickets
         def iterator():
             return iter([make_ticket(i) for i in range(10)])
-        self.client = SimpleNamespace(search_export=lambda query, **kwargs: iterator())
+
+        def search_export(query, **kwargs):
+            page_sizes.append(kwargs.get("cursor_pagination"))
+            return iterator()
+        self.client = SimpleNamespace(search_export=search_export)
         self.base_url = "https://example"
         self.auth_header = "Basic xxx"
 
+    page_sizes = []
     monkeypatch.setattr(ZendeskClient, "__init__", fake_init, raising=False)
 
     client = ZendeskClient("s", "e", "t")
@@ -57,3 +62,5 @@ def test_search_tickets_export_has_more_flag(monkeypatch):
     assert res2["count"] == 10
     assert res2.get("has_more") in (False, None)
 
+    # Export pages are sized to what will be consumed, up to the endpoint maximum
+    assert page_sizes == [5, 1000]
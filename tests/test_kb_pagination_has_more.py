@@ -85,3 +85,54 @@ def test_search_articles_by_labels_respects_per_page_and_has_more(monkeypatch):
     assert res["has_more"] is False
     assert len(res["articles"]) == 2
 
+
+
+def test_get_all_articles_follows_cursor_pages(monkeypatch):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.zendesk_client import ZendeskClient
+
+    pages = {
+        "/help_center/sections": {
+            "sections": [{"id": 1, "name": "General", "description": "d"}, {"id": 2, "name": "Empty", "description": None}],
+            "meta": {"has_more": False},
+            "links": {"next": None},
+        },
+        "/help_center/articles": {
+            "articles": [{"id": 10, "section_id": 1, "title": "A", "body": "b", "updated_at": "2025-01-01T00:00:00Z", "html_url": "u10"}],
+            "meta": {"has_more": True},
+            "links": {"next": "https://example/articles?page[after]=x"},
+        },
+        "https://example/articles?page[after]=x": {
+            "articles": [{"id": 11, "section_id": 1, "title": "B", "body": "c", "updated_at": "2025-01-02T00:00:00Z", "html_url": "u11"}],
+            "meta": {"has_more": False},
+            "links": {"next": None},
+        },
+    }
+    requested = []
+
+    def fake_init(self, subdomain, email, token):
+        self.base_url = "https://example"
+        self.auth_header = "Basic xxx"
+
+    def fake_get_json(self, path, params=None):
+        requested.append((path, params))
+        return pages[path]
+
+    def fake_get_json_url(self, url):
+        requested.append((url, None))
+        return pages[url]
+
+    monkeypatch.setattr(ZendeskClient, "__init__", fake_init, raising=False)
+    monkeypatch.setattr(ZendeskClient, "_get_json", fake_get_json)
+    monkeypatch.setattr(ZendeskClient, "_get_json_url", fake_get_json_url)
+
+    kb = ZendeskClient("s", "e", "t").get_all_articles()
+
+    assert list(kb) == ["General", "Empty"]
+    assert [a["id"] for a in kb["General"]["articles"]] == [10, 11]
+    assert kb["General"]["articles"][0] == {
+        "id": 10, "title": "A", "body": "b", "updated_at": "2025-01-01T00:00:00Z", "url": "u10"
+    }
+    assert kb["Empty"] == {"section_id": 2, "description": None, "articles": []}
+    assert all(params == {"page[size]": 100} for path, params in requested if path.startswith("/"))
+    assert len(requested) == 3
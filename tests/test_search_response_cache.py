@@ -0,0 +1,148 @@
+import asyncio
+import json
+import sys
+import threading
+import types
+
+import pytest
+
+
+def inject_fake_zenpy():
+    zenpy_mod = types.ModuleType("zenpy")
+    zenpy_mod.Zenpy = type("Zenpy", (), {})
+    lib_mod = types.ModuleType("zenpy.lib")
+    api_objects_mod = types.ModuleType("zenpy.lib.api_objects")
+    api_objects_mod.Comment = type("Comment", (), {})
+    api_objects_mod.Ticket = type("Ticket", (), {})
+    sys.modules.setdefault("zenpy", zenpy_mod)
+    sys.modules.setdefault("zenpy.lib", lib_mod)
+    sys.modules.setdefault("zenpy.lib.api_objects", api_objects_mod)
+
+
+def test_search_statistics_cached_and_single_flight(monkeypatch):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import tools
+
+    monkeypatch.setattr(tools, "_SEARCH_CACHE", {})
+    calls = []
+    release = threading.Event()
+
+    class FakeClient:
+        def get_search_statistics(self, query, **kwargs):
+            calls.append(query)
+            release.wait(5)
+            return {"query": query, "total_tickets": 3}
+
+    client = FakeClient()
+
+    async def run():
+        first = [
+            asyncio.ensure_future(tools.handle_get_search_statistics(client, {"query": "status:open", "x": [1, 2]}))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*first)
+        # Same arguments in a different key order hit the cache
+        again = await tools.handle_get_search_statistics(client, {"x": [1, 2], "query": "status:open"})
+        other = await tools.handle_get_search_statistics(client, {"query": "status:new"})
+        return results, again, other
+
+    results, again, other = asyncio.run(run())
+
+    assert calls == ["status:open", "status:new"]
+    assert all(r is results[0] for r in results)
+    assert again is results[0]
+    assert json.loads(other[0].text)["query"] == "status:new"
+
+
+def test_search_cache_does_not_keep_failures(monkeypatch):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import tools
+
+    monkeypatch.setattr(tools, "_SEARCH_CACHE", {})
+    attempts = []
+
+    class FakeClient:
+        def search_by_date_range(self, **kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return {"tickets": []}
+
+    client = FakeClient()
+    try:
+        asyncio.run(tools.handle_search_by_date_range(client, {"date_field": "created"}))
+    except RuntimeError:
+        pass
+    asyncio.run(tools.handle_search_by_date_range(client, {"date_field": "created"}))
+
+    assert len(attempts) == 2
+
+
+def test_case_volume_analytics_splits_long_series(monkeypatch):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import tools
+
+    monkeypatch.setattr(tools, "_SEARCH_CACHE", {})
+    monkeypatch.setattr(tools, "RESPONSE_CHUNK_SIZE", 10)
+
+    class FakeClient:
+        def get_case_volume_analytics(self, **kwargs):
+            days = kwargs["max_results"]
+            return {
+                "totals": {"tickets": days},
+                "daily_counts": [{"date": f"d{i}", "count": 1} for i in range(days)],
+                "technician_weekly_counts": [{"display_key": "1", "weeks": [{"week": "w", "count": days}]}],
+            }
+
+    short = asyncio.run(tools.handle_get_case_volume_analytics(FakeClient(), {"max_results": 3}))
+    assert len(short) == 1
+    assert len(json.loads(short[0].text)["daily_counts"]) == 3
+
+    long = asyncio.run(tools.handle_get_case_volume_analytics(FakeClient(), {"max_results": 25}))
+    head = json.loads(long[0].text)
+    assert head == {"totals": {"tickets": 25}, "chunks": 4}
+    parts = [json.loads(item.text) for item in long[1:]]
+    assert sum(len(p.get("daily_counts", ())) for p in parts) == 25
+    assert parts[-1]["technician_weekly_counts"][0]["display_key"] == "1"
+
+
+def test_search_export_can_write_tickets_to_resource(monkeypatch, tmp_path):
+    inject_fake_zenpy()
+    from zendesk_mcp_server import exports, server
+    from zendesk_mcp_server.handlers import tools
+
+    monkeypatch.setattr(exports, "EXPORT_OUTPUT_DIR", str(tmp_path))
+
+    class FakeClient:
+        def search_tickets_export(self, query, **kwargs):
+            tickets = [{"id": i, "subject": f"s{i}"} for i in range(8)]
+            return {"tickets": tickets, "count": len(tickets), "has_more": False}
+
+    def export():
+        result = asyncio.run(tools.handle_search_tickets_export(FakeClient(), {"query": "status:open", "output_file": True}))
+        assert len(result) == 1
+        return json.loads(result[0].text)
+
+    body, again = export(), export()
+
+    assert body["count"] == 8
+    assert "tickets" not in body
+    assert [t["id"] for t in body["preview"]] == [0, 1, 2, 3, 4]
+    # Identical exports get their own resource instead of overwriting each other
+    assert body["resource_uri"].startswith("zendesk://exports/")
+    assert again["resource_uri"] != body["resource_uri"]
+
+    listed = {str(r.uri) for r in asyncio.run(server.handle_list_resources())}
+    assert {body["resource_uri"], again["resource_uri"]} <= listed
+    text = asyncio.run(server.handle_read_resource(server.AnyUrl(body["resource_uri"])))
+    assert [json.loads(line)["id"] for line in text.splitlines()] == list(range(8))
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # Past the file cap the oldest exports are pruned
+    monkeypatch.setattr(exports, "EXPORT_MAX_FILES", 2)
+    newest = export()
+    assert exports.list_exports() == [newest["resource_uri"].rsplit("/", 1)[1], again["resource_uri"].rsplit("/", 1)[1]]
+    with pytest.raises(ValueError):
+        asyncio.run(server.handle_read_resource(server.AnyUrl(body["resource_uri"])))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import pytest
@@ -7,12 +8,17 @@ from zendesk_mcp_server import server
 
 @pytest.fixture(autouse=True)
 def reset_client_cache(monkeypatch):
-    # Ensure each test starts with a clean client/settings cache.
-    server._reset_client_cache_for_tests()
+    # Ensure each test starts with a clean client/settings/KB cache.
+    server.get_settings.cache_clear()
+    server.get_zendesk_client.cache_clear()
+    monkeypatch.setattr(server, "_kb_cache", {"json": None, "expires": 0.0})
+    # Each test runs its own event loop, and a contended lock stays bound to one
+    monkeypatch.setattr(server, "_kb_lock", asyncio.Lock())
     for key in server.REQUIRED_ENV_VARS:
         monkeypatch.delenv(key, raising=False)
     yield
-    server._reset_client_cache_for_tests()
+    server.get_settings.cache_clear()
+    server.get_zendesk_client.cache_clear()
     # Clean up env vars to avoid leakage between tests.
     for key in server.REQUIRED_ENV_VARS:
         monkeypatch.delenv(key, raising=False)
@@ -65,3 +71,83 @@ def test_configure_logging_idempotent():
             server.logger.removeHandler(handler)
         for handler in original_handlers:
             server.logger.addHandler(handler)
+
+
+def test_knowledge_base_resource_single_flight(monkeypatch):
+    import asyncio
+    import json
+    import threading
+
+    from pydantic import AnyUrl
+
+    calls = []
+    release = threading.Event()
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def get_all_articles(self):
+            calls.append(1)
+            release.wait(5)
+            return {"General": {"articles": [{"id": 1}, {"id": 2}]}}
+
+    for key in server.REQUIRED_ENV_VARS:
+        monkeypatch.setenv(key, "x")
+    monkeypatch.setattr("zendesk_mcp_server.zendesk_client.ZendeskClient", FakeClient)
+
+    async def read_concurrently():
+        reads = [asyncio.ensure_future(server.handle_read_resource(AnyUrl("zendesk://knowledge-base"))) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*reads)
+
+    bodies = asyncio.run(read_concurrently())
+
+    # Concurrent misses share one fetch, and later reads are served from the cache
+    assert len(calls) == 1
+    assert len(set(bodies)) == 1
+    assert json.loads(bodies[0])["metadata"] == {"sections": 1, "total_articles": 2}
+    asyncio.run(server.handle_read_resource(AnyUrl("zendesk://knowledge-base")))
+    assert len(calls) == 1
+
+
+def test_tool_handlers_enforce_schema_required_arguments():
+    # Handlers are the only argument validation, so they must reject exactly what
+    # each inputSchema marks as required.
+    import asyncio
+
+    from zendesk_mcp_server.handlers import TOOL_HANDLERS
+
+    assert set(TOOL_HANDLERS) == {tool.name for tool in server._TOOLS}
+    for tool in server._TOOLS:
+        required = tool.inputSchema.get("required") or []
+        if not required:
+            continue
+        with pytest.raises(ValueError) as excinfo:
+            asyncio.run(TOOL_HANDLERS[tool.name](object(), {"unrelated": True}))
+        message = str(excinfo.value)
+        assert all(key in message for key in required), (tool.name, message)
+
+
+def test_call_tool_reports_unknown_tools_and_handler_errors(monkeypatch):
+    import asyncio
+
+    for key in server.REQUIRED_ENV_VARS:
+        monkeypatch.setenv(key, "x")
+    monkeypatch.setattr("zendesk_mcp_server.zendesk_client.ZendeskClient", lambda **kwargs: object())
+
+    unknown = asyncio.run(server.handle_call_tool("no_such_tool", {}))
+    assert unknown[0].text == "Error: Unknown tool: no_such_tool"
+
+    failed = asyncio.run(server.handle_call_tool("get_ticket", {}))
+    assert failed[0].text == "Error: Missing arguments"
+
+
+def test_load_env_file_can_be_disabled(monkeypatch):
+    import sys
+
+    monkeypatch.setenv("ZENDESK_MCP_LOAD_DOTENV", "0")
+    # Importing dotenv would now raise, so this also checks it is never imported
+    monkeypatch.setitem(sys.modules, "dotenv", None)
+    assert server.load_env_file.__wrapped__() is False
@@ -0,0 +1,76 @@
+import sys
+import types
+import json
+import urllib.parse
+
+
+def inject_fake_zenpy():
+    zenpy_mod = types.ModuleType("zenpy")
+    zenpy_mod.Zenpy = type("Zenpy", (), {})
+    lib_mod = types.ModuleType("zenpy.lib")
+    api_objects_mod = types.ModuleType("zenpy.lib.api_objects")
+    api_objects_mod.Comment = type("Comment", (), {})
+    api_objects_mod.Ticket = type("Ticket", (), {})
+    sys.modules.setdefault("zenpy", zenpy_mod)
+    sys.modules.setdefault("zenpy.lib", lib_mod)
+    sys.modules.setdefault("zenpy.lib.api_objects", api_objects_mod)
+
+
+class DummyResponse:
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def read(self):
+        return json.dumps(self._payload).encode("utf-8")
+
+
+def _fake_client_init(self, subdomain, email, token):
+    self.client = types.SimpleNamespace()
+    self.subdomain = subdomain
+    self.base_url = "https://example/api/v2"
+    self.auth_header = "Basic xxx"
+
+
+def test_show_many_tickets_batches_ids_by_100(monkeypatch):
+    inject_fake_zenpy()
+    import zendesk_mcp_server.zendesk_client as zc
+
+    requested_batches = []
+
+    def fake_urlopen(req, max_attempts=5):
+        url = getattr(req, "full_url", str(req))
+        assert "/tickets/show_many.json" in url
+        ids = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)["ids"][0].split(",")
+        requested_batches.append(len(ids))
+        return DummyResponse({
+            "tickets": [
+                {
+                    "id": int(i),
+                    "status": "solved",
+                    "satisfaction_rating": {"score": "good", "comment": "thanks"} if int(i) == 1 else None,
+                    "custom_fields": [{"id": 7, "value": "gold"}],
+                }
+                for i in ids
+                if int(i) != 150  # simulate a deleted ticket
+            ]
+        })
+
+    monkeypatch.setattr("zendesk_mcp_server.client.base._urlopen_with_retry", fake_urlopen, raising=False)
+    monkeypatch.setattr(zc.ZendeskClient, "__init__", _fake_client_init, raising=False)
+
+    client = zc.ZendeskClient("s", "e", "t")
+    result = client.show_many_tickets(list(range(1, 251)))
+
+    assert requested_batches == [100, 100, 50]
+    assert result["count"] == 249
+    by_id = {t["id"]: t for t in result["tickets"]}
+    assert 150 not in by_id
+    assert by_id[1]["satisfaction_rating"] == {"score": "good", "comment": "thanks"}
+    assert by_id[2]["satisfaction_rating"] is None
+    assert by_id[2]["custom_fields"] == [{"id": 7, "value": "gold"}]
@@ -0,0 +1,317 @@
+import sys
+import types
+import json
+import urllib.parse
+
+
+def inject_fake_zenpy():
+    zenpy_mod = types.ModuleType("zenpy")
+    zenpy_mod.Zenpy = type("Zenpy", (), {})
+    lib_mod = types.ModuleType("zenpy.lib")
+    api_objects_mod = types.ModuleType("zenpy.lib.api_objects")
+    api_objects_mod.Comment = type("Comment", (), {})
+    api_objects_mod.Ticket = type("Ticket", (), {})
+    sys.modules.setdefault("zenpy", zenpy_mod)
+    sys.modules.setdefault("zenpy.lib", lib_mod)
+    sys.modules.setdefault("zenpy.lib.api_objects", api_objects_mod)
+
+
+class DummyResponse:
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def read(self):
+        return json.dumps(self._payload).encode("utf-8")
+
+
+def _fake_client_init(self, subdomain, email, token):
+    self.client = types.SimpleNamespace()
+    self.subdomain = subdomain
+    self.base_url = "https://example/api/v2"
+    self.auth_header = "Basic xxx"
+
+def test_list_survey_responses_guide_compact(monkeypatch):
+    inject_fake_zenpy()
+    import zendesk_mcp_server.zendesk_client as zc
+
+    payload = {
+        "survey_responses": [
+            {
+                "id": "r1",
+                "created_at": "2025-01-02T00:00:00Z",
+                "responder_id": 42,
+                "survey_id": "s1",
+                "expires_at": None,
+                "locale": "en-us",
+                "subjects": [{"type": "ticket", "subject_zrn": "zen:ticket:9", "extra": "x"}, {"zrn": "zen:organization:3"}],
+                "answers": [
+                    {"type": "rating_scale", "rating": 5, "rating_category": "good", "question": {"headline": "How?"}},
+                    {"type": "open_ended", "value": "great", "question": {"headline": "Why?"}},
+                ],
+            }
+        ],
+        "meta": {"has_more": False},
+    }
+
+    monkeypatch.setattr(
+        "zendesk_mcp_server.client.base._urlopen_with_retry",
+        lambda req, max_attempts=5: DummyResponse(payload),
+        raising=False,
+    )
+    monkeypatch.setattr(zc.ZendeskClient, "__init__", _fake_client_init, raising=False)
+
+    client = zc.ZendeskClient("s", "e", "t")
+    full = client.list_survey_responses_guide()
+    assert full["survey_responses"] == payload["survey_responses"]
+
+    compact = client.list_survey_responses_guide(compact=True)
+    assert compact["meta"] == {"has_more": False}
+    assert compact["survey_responses"] == [
+        {
+            "id": "r1",
+            "created_at": "2025-01-02T00:00:00Z",
+            "responder_id": 42,
+            "survey_id": "s1",
+            "expires_at": None,
+            "subjects": [{"subject_zrn": "zen:ticket:9"}, {"subject_zrn": "zen:organization:3"}],
+            "answers": [
+                {"type": "rating_scale", "rating": 5, "rating_category": "good"},
+                {"type": "open_ended", "value": "great"},
+            ],
+        }
+    ]
+
+    answers_only = client.list_survey_responses_guide(fields=("answers",))
+    assert answers_only["survey_responses"] == [
+        {"answers": compact["survey_responses"][0]["answers"]}
+    ]
+
+
+def test_list_survey_responses_guide_uses_cursor_page_size(monkeypatch):
+    inject_fake_zenpy()
+    import zendesk_mcp_server.zendesk_client as zc
+
+    captured = []
+
+    def fake_urlopen(req, max_attempts=5):
+        url = getattr(req, "full_url", str(req))
+        captured.append(urllib.parse.parse_qs(urllib.parse.urlparse(url).query))
+        return DummyResponse({"survey_responses": [], "meta": {"has_more": False}})
+
+    monkeypatch.setattr("zendesk_mcp_server.client.base._urlopen_with_retry", fake_urlopen, raising=False)
+    monkeypatch.setattr(zc.ZendeskClient, "__init__", _fake_client_init, raising=False)
+
+    client = zc.ZendeskClient("s", "e", "t")
+    client.list_survey_responses_guide(cursor="abc")
+
+    assert captured[0]["page[size]"] == ["100"]
+    assert captured[0]["page[after]"] == ["abc"]
+
+
+def test_list_survey_responses_guide_async_without_httpx(monkeypatch):
+    inject_fake_zenpy()
+    import asyncio
+    import zendesk_mcp_server.zendesk_client as zc
+
+    captured = []
+
+    def fake_urlopen(req, max_attempts=5):
+        url = getattr(req, "full_url", str(req))
+        captured.append(urllib.parse.parse_qs(urllib.parse.urlparse(url).query))
+        return DummyResponse({"survey_responses": [{"id": "r1", "locale": "en-us"}], "meta": {"has_more": False}})
+
+    # Falls back to the sync urllib path on the default executor
+    monkeypatch.setattr("zendesk_mcp_server.client.base.httpx", None)
+    monkeypatch.setattr("zendesk_mcp_server.client.base._urlopen_with_retry", fake_urlopen, raising=False)
+    monkeypatch.setattr(zc.ZendeskClient, "__init__", _fake_client_init, raising=False)
+
+    client = zc.ZendeskClient("s", "e", "t")
+    result = asyncio.run(client.list_survey_responses_guide_async(cursor="abc", fields=("id",)))
+
+    assert result == {"survey_responses": [{"id": "r1"}], "meta": {"has_more": False}}
+    assert captured[0]["page[after]"] == ["abc"]
+
+
+def test_list_survey_responses_guide_async_retries_429(monkeypatch):
+    httpx = __import__("pytest").importorskip("httpx")
+    inject_fake_zenpy()
+    import asyncio
+    import zendesk_mcp_server.client.base as base
+    import zendesk_mcp_server.zendesk_client as zc
+
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"survey_responses": [{"id": "r1"}], "meta": {"has_more": False}})
+
+    monkeypatch.setattr(base, "_build_async_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(zc.ZendeskClient, "__init__", _fake_client_init, raising=False)
+
+    async def run():
+        client = zc.ZendeskClient("s", "e", "t")
+        try:
+            return await client.list_survey_responses_guide_async()
+        finally:
+            await client.aclose()
+
+    result = asyncio.run(run())
+
+    assert result["survey_responses"] == [{"id": "r1"}]
+    assert len(calls) == 2
+    assert calls[-1].headers["Authorization"] == "Basic xxx"
+    assert calls[-1].url.params["page[size]"] == "100"
+
+
+def test_list_survey_responses_limit_sets_page_size(monkeypatch):
+    inject_fake_zenpy()
+    import asyncio
+    import pytest
+    from zendesk_mcp_server.handlers import tools
+
+    calls = []
+
+    class FakeClient:
+        async def list_survey_responses_guide_async(self, **kwargs):
+            calls.append(kwargs)
+            return {
+                "survey_responses": [
+                    {"id": f"r{i}", "answers": [{"type": "rating_scale", "rating": 5}]}
+                    for i in range(kwargs["page_size"])
+                ],
+                "meta": {"has_more": True, "after_cursor": "next"},
+            }
+
+    result = json.loads(asyncio.run(tools.handle_list_survey_responses_zendesk(FakeClient(), {"limit": "2"}))[0].text)
+
+    assert calls[0]["page_size"] == 2
+    assert [r["survey_response_id"] for r in result["survey_responses"]] == ["r0", "r1"]
+    assert result["next_cursor"] == "next"
+    assert result["has_more"] is True
+
+    asyncio.run(tools.handle_list_survey_responses_zendesk(FakeClient(), {"limit": 500}))
+    assert calls[-1]["page_size"] == 100
+
+    for bad in (0, -3):
+        with pytest.raises(ValueError):
+            asyncio.run(tools.handle_list_survey_responses_zendesk(FakeClient(), {"limit": bad}))
+
+
+def test_split_ms_range_tiles_the_whole_range():
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import tools
+
+    for start, end, parts in ((0, 99, 4), (1000, 1010, 4), (5, 8, 4), (17, 1_000_003, 3)):
+        shards = tools._split_ms_range(start, end, parts)
+        assert len(shards) == parts
+        assert shards[0][0] == start
+        assert shards[-1][1] == end
+        assert all(lo <= hi for lo, hi in shards)
+        assert all(shards[i][1] + 1 == shards[i + 1][0] for i in range(parts - 1))
+
+
+def test_count_survey_responses_shards_match_single_walk(monkeypatch):
+    inject_fake_zenpy()
+    import asyncio
+    from zendesk_mcp_server.handlers import tools
+
+    # One response per millisecond, ratings cycling 1..5
+    responses = [
+        {"id": f"r{ms}", "created_at_ms": ms, "answers": [{"type": "rating_scale", "rating": ms % 5 + 1}]}
+        for ms in range(1000, 1100)
+    ]
+    fetched = []
+
+    class FakeClient:
+        async def list_survey_responses_guide_async(self, cursor=None, created_at_start_ms=None,
+                                                    created_at_end_ms=None, **kwargs):
+            fetched.append(created_at_start_ms)
+            matching = [
+                r for r in responses
+                if created_at_start_ms <= r["created_at_ms"] <= created_at_end_ms
+            ]
+            offset = int(cursor or 0)
+            page = matching[offset:offset + 7]
+            has_more = offset + 7 < len(matching)
+            return {
+                "survey_responses": page,
+                "meta": {"has_more": has_more, "after_cursor": str(offset + 7) if has_more else None},
+            }
+
+    def count(shards, start=1003, end=1090):
+        fetched.clear()
+        monkeypatch.setattr(tools, "SURVEY_COUNT_SHARDS", shards)
+        args = {"created_at_start_ms": start, "created_at_end_ms": end, "rating_min": 4}
+        return json.loads(asyncio.run(tools.handle_count_survey_responses_zendesk(FakeClient(), args))[0].text)
+
+    single = count(1)
+    sharded = count(4)
+
+    assert single["total_count"] == sum(1 for ms in range(1003, 1091) if ms % 5 + 1 >= 4)
+    assert sharded["total_count"] == single["total_count"]
+    assert single["truncated"] is sharded["truncated"] is False
+
+    # Responses packed into the first shard: it may use the pages the empty shards leave over
+    responses[:] = [r for r in responses if r["created_at_ms"] < 1060]
+    monkeypatch.setattr(tools, "SURVEY_PAGE_LIMIT", 12)
+    packed = count(4, 1000, 1399)
+    assert packed["total_count"] == sum(1 for ms in range(1000, 1060) if ms % 5 + 1 >= 4)
+    assert packed["truncated"] is False
+    assert fetched.count(1000) == 9
+
+    # Running out of pages is reported instead of passing a partial count off as exact
+    monkeypatch.setattr(tools, "SURVEY_PAGE_LIMIT", 5)
+    short = count(4, 1000, 1399)
+    assert len(fetched) == 5
+    assert short["truncated"] is True
+    assert short["total_count"] < packed["total_count"]
+
+
+def test_date_to_ms_accepts_non_padded_dates_and_rejects_garbage():
+    inject_fake_zenpy()
+    import pytest
+    from zendesk_mcp_server.handlers import tools
+
+    assert tools._date_to_ms("2024-1-5") == tools._date_to_ms("2024-01-05") == 1704412800000
+    assert tools._date_to_ms("2024-1-5", end_of_day=True) == 1704412800000 + 86_400_000 - 1
+    assert tools._date_to_ms(None) is None
+    for bad in ("2024-13-01", "05/01/2024", "yesterday"):
+        with pytest.raises(ValueError):
+            tools._date_to_ms(bad)
+
+
+def test_search_tickets_by_csat_only_checks_surveys_for_unmatched_tickets():
+    inject_fake_zenpy()
+    import asyncio
+    from zendesk_mcp_server.handlers import tools
+
+    survey_calls = []
+
+    class FakeClient:
+        def search_tickets_export(self, **kwargs):
+            return {"tickets": [
+                {"id": 1, "satisfaction_rating": {"score": 5}},
+                {"id": 2, "satisfaction_rating": None},
+                {"id": 3, "satisfaction_rating": None},
+            ]}
+
+        def show_many_tickets(self, ticket_ids):
+            return {"tickets": [{"id": 2, "satisfaction_rating": {"score": 4}}, {"id": 3}]}
+
+        def get_ticket_csat_survey_responses(self, ticket_id):
+            survey_calls.append(ticket_id)
+            return {"csat_survey_responses": [{"score": 4.5, "comment": "ok"}]}
+
+    result = asyncio.run(tools.handle_search_tickets_by_csat(FakeClient(), {"csat_score": "high"}))
+    tickets = json.loads(result[0].text)["tickets"]
+
+    assert survey_calls == [3]
+    assert [(t["id"], t["csat_score"]) for t in tickets] == [(1, 5), (2, 4), (3, 4.5)]
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import sys
+import threading
+import types
+
+
+def inject_fake_zenpy():
+    zenpy_mod = types.ModuleType("zenpy")
+    zenpy_mod.Zenpy = type("Zenpy", (), {})
+    lib_mod = types.ModuleType("zenpy.lib")
+    api_objects_mod = types.ModuleType("zenpy.lib.api_objects")
+    api_objects_mod.Comment = type("Comment", (), {})
+    api_objects_mod.Ticket = type("Ticket", (), {})
+    sys.modules.setdefault("zenpy", zenpy_mod)
+    sys.modules.setdefault("zenpy.lib", lib_mod)
+    sys.modules.setdefault("zenpy.lib.api_objects", api_objects_mod)
+
+
+def make_client(barrier=None):
+    searches = []
+
+    def wait():
+        if barrier is not None:
+            # Times out (BrokenBarrierError) unless the calls run concurrently
+            barrier.wait()
+
+    def get_ticket(ticket_id):
+        return {"id": ticket_id, "subject": "Printer on fire"}
+
+    def get_ticket_comments(ticket_id):
+        wait()
+        return [{"id": 1, "body": "help"}]
+
+    def search_articles(query, per_page):
+        wait()
+        searches.append((query, per_page))
+        return {"articles": [{"id": 9, "title": "Fire safety"}]}
+
+    # A class rather than SimpleNamespace: the ticket batcher keys on a weakref to the client
+    class FakeClient:
+        pass
+
+    client = FakeClient()
+    client.get_ticket = get_ticket
+    client.get_ticket_comments = get_ticket_comments
+    client.search_articles = search_articles
+    return client, searches
+
+
+def test_get_ticket_context_fetches_concurrently():
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import TOOL_HANDLERS
+
+    client, searches = make_client(threading.Barrier(2, timeout=5))
+    result = asyncio.run(TOOL_HANDLERS["get_ticket_context"](client, {"ticket_id": 101, "kb_query": "fire"}))
+    payload = json.loads(result[0].text)
+
+    assert payload["ticket"]["id"] == 101
+    assert payload["comments"] == [{"id": 1, "body": "help"}]
+    assert payload["kb_articles"]["articles"][0]["id"] == 9
+    assert searches == [("fire", 5)]
+
+
+def test_get_ticket_context_searches_kb_by_subject():
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import TOOL_HANDLERS
+
+    client, searches = make_client()
+    asyncio.run(TOOL_HANDLERS["get_ticket_context"](client, {"ticket_id": 102, "kb_limit": 3}))
+
+    assert searches == [("Printer on fire", 3)]
+
+
+def test_get_ticket_comments_reused_until_ticket_changes(monkeypatch):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import tools
+
+    monkeypatch.setattr(tools, "_TICKET_CACHE", {})
+    monkeypatch.setattr(tools, "_COMMENTS_CACHE", {})
+    calls = []
+
+    class FakeClient:
+        def get_ticket_comments(self, ticket_id):
+            calls.append(ticket_id)
+            return [{"id": len(calls)}]
+
+    client = FakeClient()
+
+    # Without a cached ticket there is no updated_at to key on
+    asyncio.run(tools.handle_get_ticket_comments(client, {"ticket_id": 7}))
+    asyncio.run(tools.handle_get_ticket_comments(client, {"ticket_id": 7}))
+    assert calls == [7, 7]
+
+    tools._TICKET_CACHE[7] = {"id": 7, "updated_at": "t1"}
+    first = asyncio.run(tools.handle_get_ticket_comments(client, {"ticket_id": "7"}))
+    again = asyncio.run(tools.handle_get_ticket_comments(client, {"ticket_id": 7}))
+    assert again is first
+    assert len(calls) == 3
+
+    tools._TICKET_CACHE[7] = {"id": 7, "updated_at": "t2"}
+    newer = asyncio.run(tools.handle_get_ticket_comments(client, {"ticket_id": 7}))
+    assert len(calls) == 4
+    assert json.loads(newer[0].text) == [{"id": 4}]
+
+
+def test_get_ticket_batches_only_while_a_fetch_is_in_flight(monkeypatch):
+    inject_fake_zenpy()
+    import time
+    from zendesk_mcp_server.handlers import tools
+
+    monkeypatch.setattr(tools, "_TICKET_CACHE", {})
+    single, batches = [], []
+
+    class FakeClient:
+        def get_ticket(self, ticket_id):
+            single.append(ticket_id)
+            return {"id": ticket_id}
+
+        def show_many_tickets(self, ticket_ids):
+            batches.append(sorted(ticket_ids))
+            return {"tickets": [{"id": i, "custom_fields": []} for i in ticket_ids]}
+
+    client = FakeClient()
+
+    # A lone call is sent at once instead of waiting out the batch window
+    monkeypatch.setattr(tools, "TICKET_BATCH_WINDOW", 5)
+    started = time.monotonic()
+    asyncio.run(tools.handle_get_ticket(client, {"ticket_id": 1}))
+    assert time.monotonic() - started < 1
+    assert single == [1] and batches == []
+
+    # Calls arriving behind it share one show_many request
+    monkeypatch.setattr(tools, "TICKET_BATCH_WINDOW", 0.02)
+
+    async def run():
+        return await asyncio.gather(*(tools.handle_get_ticket(client, {"ticket_id": i}) for i in (2, 3, 4)))
+
+    results = asyncio.run(run())
+    assert [json.loads(r[0].text) for r in results] == [{"id": 2}, {"id": 3}, {"id": 4}]
+    assert single == [1, 2]
+    assert batches == [[3, 4]]
+
+
+def test_get_ticket_sla_status_reads_ticket_through_cache(monkeypatch):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.handlers import tools
+
+    monkeypatch.setattr(tools, "_TICKET_CACHE", {5: {"id": 5, "subject": "Cached"}})
+
+    class FakeClient:
+        def get_ticket(self, ticket_id):
+            raise AssertionError("cached ticket should be reused")
+
+        async def get_ticket_metric_events_async(self, ticket_id):
+            return {"metric_events": []}
+
+    result = asyncio.run(tools.handle_get_ticket_sla_status(FakeClient(), {"ticket_id": 5}))
+
+    assert json.loads(result[0].text)["ticket_subject"] == "Cached"
@@ -0,0 +1,54 @@
+import sys
+import types
+
+import pytest
+
+
+def inject_fake_zenpy():
+    zenpy_mod = types.ModuleType("zenpy")
+    zenpy_mod.Zenpy = type("Zenpy", (), {})
+    lib_mod = types.ModuleType("zenpy.lib")
+    api_objects_mod = types.ModuleType("zenpy.lib.api_objects")
+    api_objects_mod.Comment = type("Comment", (), {})
+    api_objects_mod.Ticket = type("Ticket", (), {})
+    sys.modules.setdefault("zenpy", zenpy_mod)
+    sys.modules.setdefault("zenpy.lib", lib_mod)
+    sys.modules.setdefault("zenpy.lib.api_objects", api_objects_mod)
+
+
+def make_client(monkeypatch, uploads):
+    inject_fake_zenpy()
+    from zendesk_mcp_server.zendesk_client import ZendeskClient
+
+    def upload(fp, target_name=None):
+        # zenpy hands the object to requests as the body; it must still be open
+        uploads.append((fp.closed, target_name, fp.read()))
+        return types.SimpleNamespace(token="tok", content_type="text/plain")
+
+    def fake_init(self, subdomain, email, token):
+        self.client = types.SimpleNamespace(attachments=types.SimpleNamespace(upload=upload))
+
+    monkeypatch.setattr(ZendeskClient, "__init__", fake_init, raising=False)
+    return ZendeskClient("s", "e", "t")
+
+
+def test_upload_attachment_streams_open_file(monkeypatch, tmp_path):
+    uploads = []
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"hello")
+
+    result = make_client(monkeypatch, uploads).upload_attachment(str(path))
+
+    assert uploads == [(False, "notes.txt", b"hello")]
+    assert result["token"] == "tok"
+    assert result["filename"] == "notes.txt"
+    assert result["size"] == 5
+
+
+def test_upload_attachment_missing_file(monkeypatch, tmp_path):
+    from zendesk_mcp_server.exceptions import ZendeskValidationError
+
+    uploads = []
+    with pytest.raises(ZendeskValidationError):
+        make_client(monkeypatch, uploads).upload_attachment(str(tmp_path / "missing.txt"))
+    assert uploads == []